@@ -1,17 +1,33 @@
 """LocalPort - Universal port forwarding manager with health monitoring."""
 
-import importlib.metadata
-
-try:
-    __version__ = importlib.metadata.version("localport")
-except importlib.metadata.PackageNotFoundError:
-    # Fallback for development/editable installs
-    __version__ = "0.0.0+dev"
-
 __author__ = "LocalPort Team"
 __email__ = "contact@localport.dev"
 __description__ = "Universal port forwarding manager with health monitoring"
 
+_version: str | None = None
+
+
+def _get_version() -> str:
+    """Resolve the installed package version, caching the metadata lookup."""
+    global _version
+    if _version is None:
+        import importlib.metadata
+
+        try:
+            _version = importlib.metadata.version("localport")
+        except importlib.metadata.PackageNotFoundError:
+            # Fallback for development/editable installs
+            _version = "0.0.0+dev"
+    return _version
+
+
+def __getattr__(name: str) -> str:
+    """Resolve __version__ lazily so importing the package stays cheap."""
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Package metadata
 __all__ = [
     "__version__",
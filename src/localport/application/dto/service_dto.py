@@ -1,14 +1,47 @@
 """Data Transfer Objects for service operations."""
 
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from uuid import UUID
 
+import msgspec
+
 from ...domain.entities.service import ForwardingTechnology, ServiceStatus
 
+_batch_now: ContextVar[datetime | None] = ContextVar("_batch_now", default=None)
+
+
+@contextmanager
+def batch_timestamp() -> Iterator[datetime]:
+    """Share one timestamp across result factories created in a bulk operation.
+
+    Bulk use cases wrap their per-service loops in this context manager so
+    the success_result factories reuse a single datetime.now() instead of
+    issuing one time lookup per service.
+    """
+    now = datetime.now()
+    token = _batch_now.set(now)
+    try:
+        yield now
+    finally:
+        _batch_now.reset(token)
+
+
+def _format_uptime(seconds: float) -> str:
+    """Format an uptime in seconds as a compact h/m/s string."""
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h {minutes}m {secs}s"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
 
-@dataclass
-class ServiceStartResult:
+class ServiceStartResult(msgspec.Struct, kw_only=True, frozen=True):
     """Result of starting a service."""
 
     service_name: str
@@ -29,7 +62,7 @@ class ServiceStartResult:
             service_name=service_name,
             success=True,
             process_id=process_id,
-            started_at=started_at or datetime.now()
+            started_at=started_at or _batch_now.get() or datetime.now()
         )
 
     @classmethod
@@ -42,8 +75,7 @@ class ServiceStartResult:
         )
 
 
-@dataclass
-class ServiceStopResult:
+class ServiceStopResult(msgspec.Struct, kw_only=True, frozen=True):
     """Result of stopping a service."""
 
     service_name: str
@@ -61,7 +93,7 @@ class ServiceStopResult:
         return cls(
             service_name=service_name,
             success=True,
-            stopped_at=stopped_at or datetime.now()
+            stopped_at=stopped_at or _batch_now.get() or datetime.now()
         )
 
     @classmethod
@@ -74,8 +106,7 @@ class ServiceStopResult:
         )
 
 
-@dataclass
-class ServiceStatusInfo:
+class ServiceStatusInfo(msgspec.Struct, kw_only=True):
     """Service status information."""
 
     id: UUID
@@ -88,19 +119,24 @@ class ServiceStatusInfo:
     started_at: datetime | None = None
     last_health_check: datetime | None = None
     restart_count: int = 0
-    tags: list[str] = None
+    tags: list[str] = msgspec.field(default_factory=list)
     description: str | None = None
     uptime_seconds: float | None = None
     is_healthy: bool = False
 
     def __post_init__(self) -> None:
-        """Initialize default values after dataclass creation."""
-        if self.tags is None:
-            self.tags = []
+        """Intern repeated strings so snapshots share one object per value.
 
+        Rebuilding tags here also means callers can pass their own list
+        without copying first; the snapshot never aliases caller state.
+        """
+        self.name = sys.intern(self.name)
+        if self.description:
+            self.description = sys.intern(self.description)
+        self.tags = [sys.intern(tag) for tag in self.tags]
 
-@dataclass
-class HealthCheckInfo:
+
+class HealthCheckInfo(msgspec.Struct, kw_only=True):
     """Health check information."""
 
     service_name: str
@@ -126,8 +162,7 @@ class HealthCheckInfo:
         return (self.consecutive_failures / self.failure_threshold) * 100
 
 
-@dataclass
-class ServiceSummary:
+class ServiceSummary(msgspec.Struct, kw_only=True):
     """Summary of all services."""
 
     total_services: int
@@ -137,24 +172,27 @@ class ServiceSummary:
     healthy_services: int
     unhealthy_services: int
     services: list[ServiceStatusInfo]
+    _success_rate: float = 0.0
+    _health_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Precompute the rates; the counts never change after construction."""
+        if self.total_services:
+            self._success_rate = (self.running_services / self.total_services) * 100
+            self._health_rate = (self.healthy_services / self.total_services) * 100
 
     @property
     def success_rate(self) -> float:
         """Get the success rate of running services."""
-        if self.total_services == 0:
-            return 0.0
-        return (self.running_services / self.total_services) * 100
+        return self._success_rate
 
     @property
     def health_rate(self) -> float:
         """Get the health rate of services."""
-        if self.total_services == 0:
-            return 0.0
-        return (self.healthy_services / self.total_services) * 100
+        return self._health_rate
 
 
-@dataclass
-class DaemonStatusInfo:
+class DaemonStatusInfo(msgspec.Struct, kw_only=True):
     """Daemon status information."""
 
     is_running: bool
@@ -171,20 +209,10 @@ class DaemonStatusInfo:
         """Get formatted uptime string."""
         if not self.uptime_seconds:
             return "N/A"
+        return _format_uptime(self.uptime_seconds)
 
-        hours, remainder = divmod(int(self.uptime_seconds), 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
 
-
-@dataclass
-class ServiceMetrics:
+class ServiceMetrics(msgspec.Struct, kw_only=True):
     """Service performance metrics."""
 
     service_name: str
@@ -198,28 +226,40 @@ class ServiceMetrics:
     last_failure: datetime | None = None
     last_restart: datetime | None = None
 
+    _reliability_score: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Precompute the reliability score from the immutable counters."""
+        if self.total_starts:
+            failure_rate = self.total_failures / self.total_starts
+            reliability = max(0.0, 1.0 - failure_rate) * 100
+            # Factor in uptime percentage
+            self._reliability_score = (reliability + self.uptime_percentage) / 2
+
     @property
     def reliability_score(self) -> float:
         """Calculate a reliability score (0-100)."""
-        if self.total_starts == 0:
-            return 0.0
-
-        failure_rate = self.total_failures / self.total_starts
-        reliability = max(0.0, 1.0 - failure_rate) * 100
+        return self._reliability_score
 
-        # Factor in uptime percentage
-        return (reliability + self.uptime_percentage) / 2
 
-
-@dataclass
-class BulkOperationResult:
+class BulkOperationResult(msgspec.Struct, kw_only=True):
     """Result of a bulk operation on multiple services."""
 
     operation: str
     total_services: int
-    successful_services: list[str]
-    failed_services: list[str]
+    successful_services: set[str]
+    failed_services: set[str]
     errors: dict[str, str]
+    _success_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Coerce list-valued service fields to sets and precompute the rate."""
+        if not isinstance(self.successful_services, set):
+            self.successful_services = set(self.successful_services)
+        if not isinstance(self.failed_services, set):
+            self.failed_services = set(self.failed_services)
+        if self.total_services:
+            self._success_rate = (self.success_count / self.total_services) * 100
 
     @property
     def success_count(self) -> int:
@@ -234,9 +274,7 @@ class BulkOperationResult:
     @property
     def success_rate(self) -> float:
         """Success rate as a percentage."""
-        if self.total_services == 0:
-            return 0.0
-        return (self.success_count / self.total_services) * 100
+        return self._success_rate
 
     @property
     def is_complete_success(self) -> bool:
@@ -249,8 +287,7 @@ class BulkOperationResult:
         return self.success_count == 0
 
 
-@dataclass
-class ConfigValidationResult:
+class ConfigValidationResult(msgspec.Struct, kw_only=True):
     """Result of configuration validation."""
 
     is_valid: bool
@@ -278,8 +315,7 @@ class ConfigValidationResult:
         self.warnings.append(warning)
 
 
-@dataclass
-class ServiceMonitorResult:
+class ServiceMonitorResult(msgspec.Struct, kw_only=True, frozen=True):
     """Result of service monitoring operation."""
     service_name: str
     is_healthy: bool
@@ -290,8 +326,7 @@ class ServiceMonitorResult:
     error: str | None = None
 
 
-@dataclass
-class DaemonStatusResult:
+class DaemonStatusResult(msgspec.Struct, kw_only=True, frozen=True):
     """Result of daemon status check."""
     running: bool
     pid: int | None = None
@@ -303,20 +338,10 @@ class DaemonStatusResult:
         """Get formatted uptime string."""
         if not self.uptime_seconds:
             return "N/A"
-
-        hours, remainder = divmod(int(self.uptime_seconds), 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        return _format_uptime(self.uptime_seconds)
 
 
-@dataclass
-class DaemonOperationResult:
+class DaemonOperationResult(msgspec.Struct, kw_only=True, frozen=True):
     """Result of daemon operation."""
     command: str
     success: bool
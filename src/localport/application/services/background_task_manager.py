@@ -0,0 +1,78 @@
+"""Lightweight background task tracking for the daemon manager."""
+
+import asyncio
+import weakref
+from collections.abc import Coroutine
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class BackgroundTaskManager:
+    """Track fire-and-forget background tasks with weak references.
+
+    Tasks are held in a WeakSet so completed tasks are reclaimed by the
+    garbage collector without discard callbacks, and shutdown cancels the
+    remaining tasks in one batched cancel-then-gather pass.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: weakref.WeakSet[asyncio.Task] = weakref.WeakSet()
+
+    def spawn(self, coro: Coroutine[Any, Any, Any], name: str | None = None) -> asyncio.Task:
+        """Create and track a background task.
+
+        Args:
+            coro: Coroutine to run in the background
+            name: Optional task name for diagnostics
+
+        Returns:
+            The created task
+        """
+        loop = asyncio.get_running_loop()
+        task = loop.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._log_exception)
+        return task
+
+    async def shutdown(self, timeout: float) -> None:
+        """Cancel all tracked tasks and wait for them to finish.
+
+        Args:
+            timeout: Maximum time to wait for tasks to complete
+        """
+        tasks = [task for task in self._tasks if not task.done()]
+        if not tasks:
+            return
+
+        logger.debug("Cancelling background tasks", task_count=len(tasks))
+
+        for task in tasks:
+            task.cancel()
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True),
+                timeout=timeout
+            )
+        except TimeoutError:
+            logger.warning("Background tasks did not complete within timeout")
+
+        logger.debug("Background tasks cancelled")
+
+    def __len__(self) -> int:
+        """Number of currently tracked (not yet collected) tasks."""
+        return len(self._tasks)
+
+    @staticmethod
+    def _log_exception(task: asyncio.Task) -> None:
+        """Surface unexpected background task failures."""
+        if task.cancelled():
+            return
+        exception = task.exception()
+        if exception is not None:
+            logger.error("Background task failed",
+                        task_name=task.get_name(),
+                        error=str(exception))
@@ -12,7 +12,7 @@ from ...domain.repositories.service_repository import ServiceRepository
 from .configuration_differ import ConfigurationDiff, ConfigurationDiffer
 from .configuration_watcher import ConfigurationWatcher, PollingConfigurationWatcher
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class ConfigurationManager:
@@ -17,7 +17,7 @@ except ImportError:
         def __init__(self):
             pass
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class ConfigurationFileHandler(FileSystemEventHandler):
@@ -3,6 +3,7 @@
 import asyncio
 import signal
 import sys
+import time
 from datetime import datetime
 from typing import Any
 
@@ -12,6 +13,7 @@ from ...domain.entities.service import Service, ServiceStatus
 from ...domain.repositories.config_repository import ConfigRepository
 from ...domain.repositories.service_repository import ServiceRepository
 from ..dto.service_dto import DaemonStatusInfo
+from .background_task_manager import BackgroundTaskManager
 from .configuration_differ import ConfigurationDiff
 from .configuration_manager import ConfigurationManager
 from .health_monitor_scheduler import HealthMonitorScheduler
@@ -19,7 +21,22 @@ from .service_manager import ServiceManager
 from .cluster_health_manager import ClusterHealthManager
 from .cluster_config_manager import ClusterConfigManager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
+
+
+def _service_hash(service: Service) -> int:
+    """Stable content hash of a service's configuration."""
+    return hash((
+        service.name,
+        service.technology,
+        service.local_port,
+        service.remote_port,
+        repr(service.connection_info),
+        repr(service.health_check_config),
+        repr(service.restart_policy),
+        tuple(sorted(service.tags)),
+        service.description,
+    ))
 
 
 class DaemonManager:
@@ -56,9 +73,14 @@ class DaemonManager:
         self._cluster_health_manager: ClusterHealthManager | None = None
 
         # Daemon state
+        self._services_cache: tuple[int, list[Service]] | None = None
+        self._service_hashes: dict[str, int] = {}
+        self._last_config_diff: tuple[set[str], set[str], set[str]] = (set(), set(), set())
         self._is_running = False
+        self._stopping = False
         self._started_at: datetime | None = None
-        self._background_tasks: set[asyncio.Task] = set()
+        self._started_monotonic: float | None = None
+        self._background_tasks = BackgroundTaskManager()
         self._shutdown_event = asyncio.Event()
 
         # Configuration
@@ -68,9 +90,11 @@ class DaemonManager:
         self._config_reload_enabled = True
         self._hot_reload_enabled = True
         self._graceful_shutdown_timeout = 30  # seconds
+        self._start_concurrency = 16  # max parallel service starts/stops
 
         # Signal handlers
         self._original_handlers: dict[int, any] = {}
+        self._loop_signal_handlers: list[int] = []
 
     async def start_daemon(self, auto_start_services: bool = True) -> None:
         """Start the daemon manager.
@@ -85,7 +109,9 @@ class DaemonManager:
         logger.info("Starting daemon manager")
 
         self._is_running = True
+        self._stopping = False
         self._started_at = datetime.now()
+        self._started_monotonic = time.monotonic()
         self._auto_start_services = auto_start_services
 
         try:
@@ -127,8 +153,9 @@ class DaemonManager:
         Args:
             timeout: Timeout for graceful shutdown
         """
-        if not self._is_running:
+        if not self._is_running or self._stopping:
             return
+        self._stopping = True
 
         logger.info("Stopping daemon manager")
 
@@ -171,7 +198,7 @@ class DaemonManager:
             await self._load_configuration()
 
             # Get current and configured services
-            current_services = await self._service_repository.find_all()
+            current_services = await self._all_services()
 
             # Stop services that are no longer configured
             # Start new services that were added
@@ -196,24 +223,20 @@ class DaemonManager:
             Daemon status information
         """
         uptime_seconds = None
-        if self._started_at:
-            uptime_seconds = (datetime.now() - self._started_at).total_seconds()
+        if self._started_monotonic is not None:
+            uptime_seconds = time.monotonic() - self._started_monotonic
 
-        # Get service counts
-        services = await self._service_repository.find_all()
+        # Get service counts in one pass
+        services = await self._all_services()
         managed_services = len(services)
-        active_forwards = len([s for s in services if s.status == ServiceStatus.RUNNING])
+        active_forwards = sum(1 for s in services if s.status == ServiceStatus.RUNNING)
 
         # Get health monitoring status
         health_checks_enabled = len(self._health_monitor._cooperative_tasks) > 0
         last_health_check = None
         if health_checks_enabled:
-            # Get the most recent health check time from any service
-            health_statuses = self._health_monitor.get_all_health_status()
-            if health_statuses:
-                recent_checks = [info.checked_at for info in health_statuses.values() if info.checked_at]
-                if recent_checks:
-                    last_health_check = max(recent_checks)
+            # Incrementally maintained by the scheduler; O(1) per poll
+            last_health_check = self._health_monitor.last_check_time
 
         return DaemonStatusInfo(
             is_running=self._is_running,
@@ -245,27 +268,76 @@ class DaemonManager:
         finally:
             await self.stop_daemon()
 
+    async def _all_services(self) -> list[Service]:
+        """Return all services, reusing a snapshot while the repository is unchanged.
+
+        The repository exposes a monotonic version counter bumped on every
+        write; as long as the version matches, the cached list is returned
+        without another repository scan.
+        """
+        version = getattr(self._service_repository, 'version', None)
+        if (version is not None
+                and self._services_cache is not None
+                and self._services_cache[0] == version):
+            return self._services_cache[1]
+
+        services = await self._service_repository.find_all()
+        if version is not None:
+            self._services_cache = (version, services)
+        return services
+
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for daemon control."""
+        """Setup signal handlers for daemon control.
+
+        Handlers are registered on the running event loop so the shutdown
+        and reload coroutines are always scheduled on the correct loop;
+        plain signal.signal is only used as a fallback when no loop is
+        running (and on Windows, where loop signal handlers are unsupported).
+        """
         if sys.platform == "win32":
             # Windows doesn't support UNIX signals
             return
 
-        def handle_shutdown(signum, frame):
-            """Handle shutdown signals."""
-            logger.info("Received shutdown signal", signal=signum)
-            asyncio.create_task(self.stop_daemon())
-
-        def handle_reload(signum, frame):
-            """Handle reload signal."""
-            logger.info("Received reload signal", signal=signum)
-            if self._config_reload_enabled:
-                asyncio.create_task(self.reload_configuration())
-
-        # Store original handlers
-        self._original_handlers[signal.SIGTERM] = signal.signal(signal.SIGTERM, handle_shutdown)
-        self._original_handlers[signal.SIGINT] = signal.signal(signal.SIGINT, handle_shutdown)
-        self._original_handlers[signal.SIGUSR1] = signal.signal(signal.SIGUSR1, handle_reload)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            def handle_shutdown(signum: int) -> None:
+                """Handle shutdown signals.
+
+                Only sets the shutdown event; run_until_shutdown drives the
+                single stop_daemon call, so repeated signals coalesce
+                instead of spawning concurrent shutdowns.
+                """
+                logger.info("Received shutdown signal", signal=signum)
+                self._shutdown_event.set()
+
+            def handle_reload(signum: int) -> None:
+                """Handle reload signal."""
+                logger.info("Received reload signal", signal=signum)
+                if self._config_reload_enabled:
+                    loop.create_task(self.reload_configuration())
+
+            loop.add_signal_handler(signal.SIGTERM, handle_shutdown, signal.SIGTERM)
+            loop.add_signal_handler(signal.SIGINT, handle_shutdown, signal.SIGINT)
+            loop.add_signal_handler(signal.SIGUSR1, handle_reload, signal.SIGUSR1)
+            self._loop_signal_handlers = [signal.SIGTERM, signal.SIGINT, signal.SIGUSR1]
+        else:
+            def handle_shutdown_sync(signum, frame):
+                """Handle shutdown signals outside a running loop."""
+                logger.info("Received shutdown signal", signal=signum)
+                self._shutdown_event.set()
+
+            def handle_reload_sync(signum, frame):
+                """Handle reload signal outside a running loop."""
+                logger.info("Received reload signal", signal=signum)
+
+            # Store original handlers
+            self._original_handlers[signal.SIGTERM] = signal.signal(signal.SIGTERM, handle_shutdown_sync)
+            self._original_handlers[signal.SIGINT] = signal.signal(signal.SIGINT, handle_shutdown_sync)
+            self._original_handlers[signal.SIGUSR1] = signal.signal(signal.SIGUSR1, handle_reload_sync)
 
         logger.debug("Signal handlers configured")
 
@@ -274,6 +346,16 @@ class DaemonManager:
         if sys.platform == "win32":
             return
 
+        if self._loop_signal_handlers:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                for signum in self._loop_signal_handlers:
+                    loop.remove_signal_handler(signum)
+            self._loop_signal_handlers.clear()
+
         for signum, handler in self._original_handlers.items():
             signal.signal(signum, handler)
 
@@ -286,14 +368,34 @@ class DaemonManager:
             # Load services from configuration
             services = await self._config_repository.load_services()
 
-            # Update service repository
-            for service in services:
-                await self._service_repository.save(service)
+            # Diff against the previous snapshot by content hash so
+            # unchanged reloads skip the repository write entirely
+            new_hashes = {s.name: _service_hash(s) for s in services}
+            old_hashes = self._service_hashes
+            added = new_hashes.keys() - old_hashes.keys()
+            removed = old_hashes.keys() - new_hashes.keys()
+            changed = {
+                name for name in new_hashes.keys() & old_hashes.keys()
+                if new_hashes[name] != old_hashes[name]
+            }
+            self._last_config_diff = (added, changed, removed)
+
+            if added or changed or removed:
+                # Swap in the new snapshot atomically so readers never see
+                # a partially reloaded configuration
+                await self._service_repository.replace_all(services)
+                self._service_hashes = new_hashes
+            else:
+                logger.debug("Configuration unchanged, skipping repository write")
 
             # Load cluster health configuration
             await self._load_cluster_configuration()
 
-            logger.info("Configuration loaded", service_count=len(services))
+            logger.info("Configuration loaded",
+                       service_count=len(services),
+                       added=len(added),
+                       changed=len(changed),
+                       removed=len(removed))
 
         except Exception as e:
             logger.error("Failed to load configuration", error=str(e))
@@ -323,7 +425,7 @@ class DaemonManager:
     async def _auto_start_configured_services(self) -> None:
         """Automatically start configured services."""
         try:
-            services = await self._service_repository.find_all()
+            services = await self._all_services()
             enabled_services = [s for s in services if getattr(s, 'enabled', True)]
 
             if not enabled_services:
@@ -332,14 +434,18 @@ class DaemonManager:
 
             logger.info("Auto-starting services", service_count=len(enabled_services))
 
-            # Start services in parallel
-            start_tasks = []
-            for service in enabled_services:
-                task = asyncio.create_task(self._start_service_safe(service))
-                start_tasks.append(task)
+            # Start services in parallel, bounded to avoid flooding the
+            # subprocess/kubectl/ssh paths with hundreds of spawns at once
+            semaphore = asyncio.Semaphore(self._start_concurrency)
 
-            # Wait for all services to start
-            results = await asyncio.gather(*start_tasks, return_exceptions=True)
+            async def guarded_start(service: Service) -> None:
+                async with semaphore:
+                    await self._start_service_safe(service)
+
+            results = await asyncio.gather(
+                *(guarded_start(s) for s in enabled_services),
+                return_exceptions=True
+            )
 
             # Log results
             success_count = sum(1 for r in results if not isinstance(r, Exception))
@@ -378,7 +484,7 @@ class DaemonManager:
         
         try:
             # Step 1: Load services from repository
-            services = await self._service_repository.find_all()
+            services = await self._all_services()
             logger.info("Loaded services from repository",
                        total_services=len(services),
                        service_names=[s.name for s in services])
@@ -507,7 +613,7 @@ class DaemonManager:
         """Start cluster health monitoring for active cluster contexts."""
         try:
             # Get all services to extract cluster contexts
-            services = await self._service_repository.find_all()
+            services = await self._all_services()
             
             # Extract cluster contexts from services
             cluster_contexts = self._cluster_config_manager.extract_cluster_contexts_from_services(services)
@@ -541,11 +647,7 @@ class DaemonManager:
     async def _start_background_tasks(self) -> None:
         """Start background tasks."""
         # Create background task for periodic maintenance
-        maintenance_task = asyncio.create_task(self._maintenance_loop())
-        self._background_tasks.add(maintenance_task)
-
-        # Add task cleanup callback
-        maintenance_task.add_done_callback(self._background_tasks.discard)
+        self._background_tasks.spawn(self._maintenance_loop(), name="maintenance_loop")
 
         logger.debug("Background tasks started")
 
@@ -555,12 +657,16 @@ class DaemonManager:
 
         try:
             while self._is_running and not self._shutdown_event.is_set():
-                # Perform periodic maintenance
-                await self._perform_maintenance()
+                # Perform periodic maintenance; the TaskGroup guarantees any
+                # awaits inside finish or cancel together if shutdown
+                # cancels us mid-iteration
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._perform_maintenance())
 
                 # Wait before next maintenance cycle (5 minutes)
                 try:
-                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=300)
+                    async with asyncio.timeout(300):
+                        await self._shutdown_event.wait()
                     break  # Shutdown requested
                 except TimeoutError:
                     continue  # Continue maintenance loop
@@ -576,7 +682,7 @@ class DaemonManager:
         """Perform periodic maintenance tasks."""
         try:
             # Clean up dead processes
-            services = await self._service_repository.find_all()
+            services = await self._all_services()
             for service in services:
                 if service.status == ServiceStatus.RUNNING:
                     # Check if process is still alive
@@ -592,13 +698,15 @@ class DaemonManager:
                         monitored_services=monitored_services,
                         healthy_services=healthy_services)
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error("Maintenance error", error=str(e))
 
     async def _stop_all_services(self) -> None:
         """Stop all running services."""
         try:
-            services = await self._service_repository.find_all()
+            services = await self._all_services()
             running_services = [s for s in services if s.status == ServiceStatus.RUNNING]
 
             if not running_services:
@@ -606,14 +714,17 @@ class DaemonManager:
 
             logger.info("Stopping all services", service_count=len(running_services))
 
-            # Stop services in parallel
-            stop_tasks = []
-            for service in running_services:
-                task = asyncio.create_task(self._stop_service_safe(service))
-                stop_tasks.append(task)
+            # Stop services in parallel, bounded like auto-start
+            semaphore = asyncio.Semaphore(self._start_concurrency)
 
-            # Wait for all services to stop
-            await asyncio.gather(*stop_tasks, return_exceptions=True)
+            async def guarded_stop(service: Service) -> None:
+                async with semaphore:
+                    await self._stop_service_safe(service)
+
+            await asyncio.gather(
+                *(guarded_stop(s) for s in running_services),
+                return_exceptions=True
+            )
 
             logger.info("All services stopped")
 
@@ -643,26 +754,7 @@ class DaemonManager:
         Args:
             timeout: Timeout for task cancellation
         """
-        if not self._background_tasks:
-            return
-
-        logger.debug("Cancelling background tasks", task_count=len(self._background_tasks))
-
-        # Cancel all tasks
-        for task in self._background_tasks:
-            task.cancel()
-
-        # Wait for tasks to complete with timeout
-        try:
-            await asyncio.wait_for(
-                asyncio.gather(*self._background_tasks, return_exceptions=True),
-                timeout=timeout
-            )
-        except TimeoutError:
-            logger.warning("Background tasks did not complete within timeout")
-
-        self._background_tasks.clear()
-        logger.debug("Background tasks cancelled")
+        await self._background_tasks.shutdown(timeout)
 
     async def _reconcile_services(self, current_services: list[Service]) -> None:
         """Reconcile current services with configuration.
@@ -672,13 +764,17 @@ class DaemonManager:
         """
         # This is a placeholder for service reconciliation logic
         # In a full implementation, this would:
-        # 1. Compare current services with newly loaded configuration
-        # 2. Stop services that are no longer configured
-        # 3. Start new services that were added
-        # 4. Restart services with changed configuration
+        # 1. Stop services that are no longer configured
+        # 2. Start new services that were added
+        # 3. Restart services with changed configuration
+        # The diff is already computed by _load_configuration.
+        added, changed, removed = self._last_config_diff
 
         logger.info("Service reconciliation completed",
-                   current_count=len(current_services))
+                   current_count=len(current_services),
+                   added=sorted(added),
+                   changed=sorted(changed),
+                   removed=sorted(removed))
 
     @property
     def is_running(self) -> bool:
@@ -693,9 +789,9 @@ class DaemonManager:
     @property
     def uptime_seconds(self) -> float | None:
         """Get daemon uptime in seconds."""
-        if not self._started_at:
+        if self._started_monotonic is None:
             return None
-        return (datetime.now() - self._started_at).total_seconds()
+        return time.monotonic() - self._started_monotonic
 
     async def set_auto_start_services(self, enabled: bool) -> None:
         """Set auto-start services configuration.
@@ -722,6 +818,15 @@ class DaemonManager:
 
         logger.info("Health monitoring configuration updated", enabled=enabled)
 
+    async def set_start_concurrency(self, limit: int) -> None:
+        """Set the maximum number of parallel service starts/stops.
+
+        Args:
+            limit: Maximum concurrent start/stop operations (minimum 1)
+        """
+        self._start_concurrency = max(1, limit)
+        logger.info("Start concurrency updated", limit=self._start_concurrency)
+
     async def set_config_reload(self, enabled: bool) -> None:
         """Set configuration reload capability.
 
@@ -12,7 +12,7 @@ from ...infrastructure.health_checks.health_check_factory import HealthCheckFact
 from ..dto.service_dto import HealthCheckInfo, ServiceMonitorResult
 from .service_manager import ServiceManager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class HealthMonitor:
@@ -14,7 +14,23 @@ from ...infrastructure.shutdown import CooperativeTask, TaskManager
 from ..dto.health_dto import HealthCheckResult
 from .restart_manager import RestartManager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
+
+
+class _HealthState:
+    """Per-service health tracking record.
+
+    Replaces three parallel dicts (latest result, failure count, last
+    check time) so the monitor loop does one lookup per probe instead
+    of three.
+    """
+
+    __slots__ = ("result", "failures", "last_check")
+
+    def __init__(self) -> None:
+        self.result: HealthCheckResult | None = None
+        self.failures: int = 0
+        self.last_check: datetime | None = None
 
 
 class HealthMonitorScheduler:
@@ -35,9 +51,8 @@ class HealthMonitorScheduler:
         
         # Replace direct task management with cooperative tasks
         self._cooperative_tasks: dict[UUID, CooperativeTask] = {}
-        self._service_health: dict[UUID, HealthCheckResult] = {}
-        self._failure_counts: dict[UUID, int] = {}
-        self._last_check_times: dict[UUID, datetime] = {}
+        self._health_states: dict[UUID, _HealthState] = {}
+        self._latest_check_time: datetime | None = None
 
     async def start_monitoring(self, services: list[Service]) -> None:
         """Start health monitoring for the given services using cooperative tasks."""
@@ -114,9 +129,7 @@ class HealthMonitorScheduler:
                 del self._cooperative_tasks[service_id]
 
                 # Clean up tracking data
-                self._failure_counts.pop(service_id, None)
-                self._last_check_times.pop(service_id, None)
-                self._service_health.pop(service_id, None)
+                self._health_states.pop(service_id, None)
 
     async def _start_service_monitoring(self, service: Service) -> None:
         """Start cooperative monitoring for a single service."""
@@ -142,7 +155,7 @@ class HealthMonitorScheduler:
         
         # Store cooperative task
         self._cooperative_tasks[service.id] = cooperative_task
-        self._failure_counts[service.id] = 0
+        self._health_states[service.id] = _HealthState()
         
         # Start the cooperative task
         await cooperative_task.start()
@@ -174,15 +187,30 @@ class HealthMonitorScheduler:
 
     def get_health_status(self, service_id: UUID) -> HealthCheckResult | None:
         """Get the latest health check result for a service."""
-        return self._service_health.get(service_id)
+        state = self._health_states.get(service_id)
+        return state.result if state is not None else None
 
     def get_all_health_status(self) -> dict[UUID, HealthCheckResult]:
         """Get health status for all monitored services."""
-        return self._service_health.copy()
+        return {
+            service_id: state.result
+            for service_id, state in self._health_states.items()
+            if state.result is not None
+        }
 
     def get_failure_count(self, service_id: UUID) -> int:
         """Get the current failure count for a service."""
-        return self._failure_counts.get(service_id, 0)
+        state = self._health_states.get(service_id)
+        return state.failures if state is not None else 0
+
+    @property
+    def last_check_time(self) -> datetime | None:
+        """Most recent health check time across all monitored services.
+
+        Maintained incrementally on each check so status polls read it in
+        O(1) instead of scanning every health record.
+        """
+        return self._latest_check_time
 
 
     async def _perform_health_check(self, service: Service) -> HealthCheckResult:
@@ -357,7 +385,7 @@ class HealthMonitorScheduler:
                        service_name=service.name,
                        cluster_context=health_result.cluster_context,
                        cluster_healthy=health_result.cluster_healthy,
-                       failure_count=self._failure_counts.get(service.id, 0),
+                       failure_count=self.get_failure_count(service.id),
                        reason="cluster_unhealthy")
             
             # Don't increment restart attempts or change service status
@@ -366,7 +394,7 @@ class HealthMonitorScheduler:
 
         logger.critical("Service restart triggered by health check failures",
                        service_name=service.name,
-                       failure_count=self._failure_counts.get(service.id, 0),
+                       failure_count=self.get_failure_count(service.id),
                        last_error=health_result.error,
                        cluster_context=health_result.cluster_context,
                        cluster_healthy=health_result.cluster_healthy)
@@ -414,19 +442,20 @@ class ServiceHealthMonitorTask(CooperativeTask):
         self._service = service
         self._health_scheduler = health_scheduler
         self._check_interval = check_interval
+        # Pre-bound logger: the service context is merged once here
+        # instead of on every iteration's log call
+        self._log = logger.bind(service_name=service.name)
 
     async def _execute_iteration(self) -> None:
         """Execute one health check iteration."""
         # Check if service is still being monitored
         if not self._health_scheduler._running:
-            logger.debug("Health monitoring stopped, ending task",
-                        service_name=self._service.name)
+            self._log.debug("Health monitoring stopped, ending task")
             await self.request_shutdown()
             return
 
         if self._service.id not in self._health_scheduler._cooperative_tasks:
-            logger.debug("Service no longer monitored, ending task",
-                        service_name=self._service.name)
+            self._log.debug("Service no longer monitored, ending task")
             await self.request_shutdown()
             return
 
@@ -434,9 +463,15 @@ class ServiceHealthMonitorTask(CooperativeTask):
             # Perform health check
             health_result = await self._health_scheduler._perform_health_check(self._service)
 
-            # Update tracking data
-            self._health_scheduler._service_health[self._service.id] = health_result
-            self._health_scheduler._last_check_times[self._service.id] = datetime.now()
+            # Update tracking data (single per-service state record)
+            now = datetime.now()
+            states = self._health_scheduler._health_states
+            state = states.get(self._service.id)
+            if state is None:
+                state = states.setdefault(self._service.id, _HealthState())
+            state.result = health_result
+            state.last_check = now
+            self._health_scheduler._latest_check_time = now
 
             # Get health config for failure threshold
             health_config = self._service.health_check_config
@@ -444,41 +479,35 @@ class ServiceHealthMonitorTask(CooperativeTask):
 
             if health_result.is_healthy:
                 # Reset failure count on successful check
-                if self._health_scheduler._failure_counts.get(self._service.id, 0) > 0:
-                    logger.info("Service health recovered",
-                               service_name=self._service.name,
-                               previous_failures=self._health_scheduler._failure_counts[self._service.id])
-                self._health_scheduler._failure_counts[self._service.id] = 0
+                if state.failures > 0:
+                    self._log.info("Service health recovered",
+                                  previous_failures=state.failures)
+                state.failures = 0
             else:
                 # Increment failure count
-                self._health_scheduler._failure_counts[self._service.id] += 1
-                failure_count = self._health_scheduler._failure_counts[self._service.id]
+                state.failures += 1
+                failure_count = state.failures
 
-                logger.warning("Service health check failed",
-                             service_name=self._service.name,
-                             failure_count=failure_count,
-                             failure_threshold=failure_threshold,
-                             error=health_result.error)
+                self._log.warning("Service health check failed",
+                                  failure_count=failure_count,
+                                  failure_threshold=failure_threshold,
+                                  error=health_result.error)
 
                 # Check if we've reached the failure threshold
                 if failure_count >= failure_threshold:
-                    logger.error("Service health failure threshold reached",
-                               service_name=self._service.name,
-                               failure_count=failure_count,
-                               threshold=failure_threshold)
+                    self._log.error("Service health failure threshold reached",
+                                    failure_count=failure_count,
+                                    threshold=failure_threshold)
 
                     # Trigger restart logic
                     await self._health_scheduler._trigger_service_restart(self._service, health_result)
 
         except Exception as e:
-            logger.exception("Error in health check iteration",
-                           service_name=self._service.name,
-                           error=str(e))
+            self._log.exception("Error in health check iteration", error=str(e))
 
     async def _handle_iteration_error(self, error: Exception) -> bool:
         """Handle errors during health check iterations."""
-        logger.warning("Health check iteration error, continuing",
-                      service_name=self._service.name,
-                      error=str(error))
+        self._log.warning("Health check iteration error, continuing",
+                          error=str(error))
         # Continue monitoring despite errors
         return True
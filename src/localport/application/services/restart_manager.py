@@ -10,7 +10,7 @@ from ...domain.entities.service import Service
 from ..dto.health_dto import RestartAttempt
 from .service_manager import ServiceManager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class RestartManager:
@@ -3,8 +3,12 @@
 import asyncio
 import json
 import os
+import socket
+import time
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from uuid import UUID
 
 import psutil
@@ -19,15 +23,26 @@ from ...infrastructure.logging.service_log_manager import get_service_log_manage
 from ...config.settings import get_settings
 from ..dto.service_dto import ServiceStartResult, ServiceStatusInfo, ServiceStopResult
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class ServiceManager:
     """Manages the lifecycle of port forwarding services."""
 
+    # How long a cached is_process_alive() result stays valid. Status sweeps
+    # and cleanup passes that overlap within this window share one syscall
+    # per process instead of probing each PID repeatedly.
+    _ALIVE_CACHE_TTL = 0.2
+
     def __init__(self):
         """Initialize the service manager."""
         self._active_forwards: dict[UUID, PortForward] = {}
+        self._alive_cache: dict[int, tuple[float, bool]] = {}
+        # pidfd-based exit watching (Linux): pid -> pidfd, plus the set of
+        # PIDs the kernel has reported as exited. Where available this
+        # replaces per-poll kill(pid, 0) probing entirely.
+        self._pidfds: dict[int, int] = {}
+        self._dead_pids: set[int] = set()
         self._adapters = {
             ForwardingTechnology.KUBECTL: KubectlAdapter(),
             ForwardingTechnology.SSH: SSHAdapter(),
@@ -36,24 +51,129 @@ class ServiceManager:
         self._state_file = self._get_state_file_path()
         self._load_persisted_state()
 
-    async def start_service(self, service: Service) -> ServiceStartResult:
+    def _check_alive(self, port_forward: PortForward) -> bool:
+        """Check if a port forward's process is alive, caching briefly.
+
+        Args:
+            port_forward: The port forward whose process to check
+
+        Returns:
+            True if the process is alive, False otherwise
+        """
+        pid = port_forward.process_id
+        if not pid:
+            return False
+
+        if pid in self._dead_pids:
+            return False
+
+        if self._watch_pid(pid):
+            # The kernel notifies us on exit, so a watched PID that has not
+            # been reported dead is alive — no polling syscall needed.
+            return True
+
+        now = time.monotonic()
+        cached = self._alive_cache.get(pid)
+        if cached is not None and now - cached[0] < self._ALIVE_CACHE_TTL:
+            return cached[1]
+
+        alive = port_forward.is_process_alive()
+        self._alive_cache[pid] = (now, alive)
+        return alive
+
+    def _watch_pid(self, pid: int) -> bool:
+        """Register kernel exit notification for a PID via pidfd, if possible.
+
+        Args:
+            pid: Process ID to watch
+
+        Returns:
+            True if the PID is being watched, False if pidfd watching is
+            unavailable (non-Linux, old kernel, dead PID, or no event loop)
+        """
+        if pid in self._pidfds:
+            return True
+        if not hasattr(os, "pidfd_open"):
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+            pidfd = os.pidfd_open(pid)
+        except (OSError, RuntimeError):
+            return False
+
+        self._pidfds[pid] = pidfd
+        loop.add_reader(pidfd, self._on_pid_exit, pid)
+        return True
+
+    def _on_pid_exit(self, pid: int) -> None:
+        """Mark a watched PID as dead when its pidfd becomes readable."""
+        self._dead_pids.add(pid)
+        self._alive_cache.pop(pid, None)
+        self._close_pidfd(pid)
+        logger.debug("Watched process exited", process_id=pid)
+
+    def _close_pidfd(self, pid: int) -> None:
+        """Unregister and close the pidfd for a PID, if one is open."""
+        pidfd = self._pidfds.pop(pid, None)
+        if pidfd is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(pidfd)
+        except RuntimeError:
+            pass
+        os.close(pidfd)
+
+    def _adapter_for(self, technology: ForwardingTechnology):
+        """Resolve the adapter for a forwarding technology.
+
+        Single lookup point for the hot start/stop paths; the adapter set
+        is fixed at construction, so no per-call caching is needed.
+
+        Args:
+            technology: The forwarding technology to resolve
+
+        Returns:
+            The adapter registered for the technology
+        """
+        return self._adapters[technology]
+
+    def _forget_alive(self, process_id: int | None) -> None:
+        """Drop a cached alive result after stopping or cleaning up a process.
+
+        Args:
+            process_id: Process ID to invalidate, if known
+        """
+        if process_id is not None:
+            self._alive_cache.pop(process_id, None)
+            self._close_pidfd(process_id)
+            # A reused PID should start with a clean slate
+            self._dead_pids.discard(process_id)
+
+    async def start_service(
+        self,
+        service: Service,
+        skip_port_check: bool = False
+    ) -> ServiceStartResult:
         """Start a port forwarding service.
 
         Args:
             service: The service to start
+            skip_port_check: Skip the port availability probe when a batch
+                caller has already verified the port is free
 
         Returns:
             ServiceStartResult with the outcome
         """
-        logger.info("Starting service", service_name=service.name)
+        log = logger.bind(service_name=service.name)
+        log.info("Starting service")
 
         try:
             # Check if service is already running by service ID
-            if service.id in self._active_forwards:
-                existing_forward = self._active_forwards[service.id]
-                if existing_forward.is_process_alive():
-                    logger.info("Service already running",
-                               service_name=service.name,
+            existing_forward = self._active_forwards.get(service.id)
+            if existing_forward is not None:
+                if self._check_alive(existing_forward):
+                    log.info("Service already running",
                                process_id=existing_forward.process_id)
                     return ServiceStartResult.success_result(
                         service_name=service.name,
@@ -62,13 +182,15 @@ class ServiceManager:
                     )
                 else:
                     # Clean up dead process
-                    logger.info("Cleaning up dead process",
-                               service_name=service.name,
+                    log.info("Cleaning up dead process",
                                process_id=existing_forward.process_id)
-                    del self._active_forwards[service.id]
+                    self._active_forwards.pop(service.id, None)
+                    self._forget_alive(existing_forward.process_id)
 
             # Check if local port is available
-            conflict_info = await self._get_port_conflict_info(service.local_port)
+            conflict_info = None
+            if not skip_port_check:
+                conflict_info = await self._get_port_conflict_info(service.local_port)
             if conflict_info:
                 if conflict_info['is_managed']:
                     error_msg = f"Port {service.local_port} is already in use by another LocalPort service (PID: {conflict_info['pid']})"
@@ -80,8 +202,7 @@ class ServiceManager:
                                f"- Use a different local port in your configuration, or\n"
                                f"- Stop the conflicting process manually if you own it")
                 
-                logger.error("Port unavailable",
-                           service_name=service.name,
+                log.error("Port unavailable",
                            port=service.local_port,
                            conflict_pid=conflict_info['pid'],
                            is_managed=conflict_info['is_managed'])
@@ -92,7 +213,7 @@ class ServiceManager:
             service.update_status(ServiceStatus.STARTING)
 
             # Get appropriate adapter
-            adapter = self._adapters[service.technology]
+            adapter = self._adapter_for(service.technology)
 
             # Start the port forward with service logging
             settings = get_settings()
@@ -108,8 +229,7 @@ class ServiceManager:
                         service.connection_info
                     )
                     
-                    logger.info("Service started with logging",
-                               service_name=service.name,
+                    log.info("Service started with logging",
                                process_id=process_id,
                                service_log_id=service_log_id)
                 else:
@@ -120,14 +240,12 @@ class ServiceManager:
                         service.connection_info
                     )
                     
-                    logger.info("Service started without logging (adapter doesn't support it)",
-                               service_name=service.name,
+                    log.info("Service started without logging (adapter doesn't support it)",
                                process_id=process_id)
                     
             except Exception as logging_error:
                 # If service logging fails, fall back to regular port forwarding
-                logger.warning("Service logging failed, falling back to regular port forwarding",
-                              service_name=service.name,
+                log.warning("Service logging failed, falling back to regular port forwarding",
                               error=str(logging_error))
                 
                 process_id = await adapter.start_port_forward(
@@ -136,8 +254,7 @@ class ServiceManager:
                     service.connection_info
                 )
                 
-                logger.info("Service started with fallback method",
-                           service_name=service.name,
+                log.info("Service started with fallback method",
                            process_id=process_id)
 
             # Create port forward entity
@@ -146,7 +263,8 @@ class ServiceManager:
                 process_id=process_id,
                 local_port=service.local_port,
                 remote_port=service.remote_port,
-                started_at=datetime.now()
+                started_at=datetime.now(),
+                monotonic_started_at=time.monotonic()
             )
 
             # Store active forward
@@ -158,8 +276,7 @@ class ServiceManager:
             # Update service status
             service.update_status(ServiceStatus.RUNNING)
 
-            logger.info("Service started successfully",
-                       service_name=service.name,
+            log.info("Service started successfully",
                        process_id=process_id,
                        local_port=service.local_port,
                        remote_port=service.remote_port)
@@ -173,8 +290,7 @@ class ServiceManager:
         except Exception as e:
             service.update_status(ServiceStatus.FAILED)
             error_msg = str(e)
-            logger.error("Failed to start service",
-                        service_name=service.name,
+            log.error("Failed to start service",
                         error=error_msg)
             return ServiceStartResult.failure_result(service.name, error_msg)
 
@@ -187,7 +303,8 @@ class ServiceManager:
         Returns:
             ServiceStopResult with the outcome
         """
-        logger.info("Stopping service", service_name=service.name)
+        log = logger.bind(service_name=service.name)
+        log.info("Stopping service")
 
         try:
             port_forward = self._active_forwards.get(service.id)
@@ -195,13 +312,12 @@ class ServiceManager:
             
             if port_forward:
                 process_id = port_forward.process_id
-                logger.info("Found active forward in memory", 
-                           service_name=service.name, 
+                log.info("Found active forward in memory", 
                            process_id=process_id)
             else:
                 # No active forward in memory, but there might be a running process
                 # Try to find kubectl processes that match this service
-                logger.info("No active forward in memory, searching for running processes", 
+                log.info("No active forward in memory, searching for running processes", 
                            service_name=service.name)
                 
                 # Look for kubectl processes using this local port
@@ -218,8 +334,7 @@ class ServiceManager:
                             cmdline = ' '.join(proc.info['cmdline'])
                             if self._validate_port_mapping(cmdline, service.local_port, service.remote_port):
                                 process_id = proc.info['pid']
-                                logger.info("Found running kubectl process for service",
-                                           service_name=service.name,
+                                log.info("Found running kubectl process for service",
                                            process_id=process_id,
                                            cmdline=cmdline)
                                 break
@@ -227,35 +342,33 @@ class ServiceManager:
                         continue
 
             if not process_id:
-                logger.info("No running process found for service", service_name=service.name)
+                log.info("No running process found for service")
                 service.update_status(ServiceStatus.STOPPED)
                 return ServiceStopResult.success_result(service.name)
 
             # Get appropriate adapter
-            adapter = self._adapters[service.technology]
+            adapter = self._adapter_for(service.technology)
 
             # Stop the port forward
             await adapter.stop_port_forward(process_id)
+            self._forget_alive(process_id)
 
-            # Remove from active forwards if it was there
-            if service.id in self._active_forwards:
-                del self._active_forwards[service.id]
-                # Persist state after removing the forward
+            # Remove from active forwards if it was there and persist the
+            # updated state; pop avoids a separate membership check
+            if self._active_forwards.pop(service.id, None) is not None:
                 self._persist_state()
 
             # Update service status
             service.update_status(ServiceStatus.STOPPED)
 
-            logger.info("Service stopped successfully",
-                       service_name=service.name,
+            log.info("Service stopped successfully",
                        process_id=process_id)
 
             return ServiceStopResult.success_result(service.name)
 
         except Exception as e:
             error_msg = str(e)
-            logger.error("Failed to stop service",
-                        service_name=service.name,
+            log.error("Failed to stop service",
                         error=error_msg)
             return ServiceStopResult.failure_result(service.name, error_msg)
 
@@ -268,22 +381,28 @@ class ServiceManager:
         Returns:
             ServiceStartResult with the outcome
         """
-        logger.info("Restarting service", service_name=service.name)
+        log = logger.bind(service_name=service.name)
+        log.info("Restarting service")
 
         try:
             # Stop the service first
             stop_result = await self.stop_service(service)
             if not stop_result.success:
-                logger.error("Failed to stop service for restart",
-                           service_name=service.name,
+                log.error("Failed to stop service for restart",
                            error=stop_result.error)
                 return ServiceStartResult.failure_result(
                     service.name,
                     f"Failed to stop for restart: {stop_result.error}"
                 )
 
-            # Wait a moment before restarting
-            await asyncio.sleep(1)
+            # Wait for the kernel to release the local port, polling rather
+            # than sleeping a fixed second; most restarts proceed in ~50ms.
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 1.0
+            while loop.time() < deadline:
+                if await self._is_port_available(service.local_port):
+                    break
+                await asyncio.sleep(0.05)
 
             # Start the service
             start_result = await self.start_service(service)
@@ -296,8 +415,7 @@ class ServiceManager:
 
         except Exception as e:
             error_msg = str(e)
-            logger.error("Failed to restart service",
-                        service_name=service.name,
+            log.error("Failed to restart service",
                         error=error_msg)
             return ServiceStartResult.failure_result(service.name, error_msg)
 
@@ -314,11 +432,12 @@ class ServiceManager:
         
         # Check in-memory state first (fast path)
         if port_forward:
-            if port_forward.is_process_alive():
+            if self._check_alive(port_forward):
                 return True
             else:
                 # Process is dead, clean up
                 del self._active_forwards[service.id]
+                self._forget_alive(port_forward.process_id)
                 self._persist_state()
         
         # No active forward in memory, search for running processes (slow path)
@@ -354,8 +473,8 @@ class ServiceManager:
         Returns:
             ServiceStatusInfo with detailed status
         """
-        logger.debug("Getting service status",
-                    service_name=service.name,
+        log = logger.bind(service_name=service.name)
+        log.debug("Getting service status",
                     service_id=str(service.id),
                     current_status=service.status.value)
         
@@ -369,7 +488,7 @@ class ServiceManager:
             local_port=service.local_port,
             remote_port=service.remote_port,
             status=service.status,
-            tags=service.tags.copy(),
+            tags=service.tags_ordered(),
             description=service.description
         )
 
@@ -382,7 +501,7 @@ class ServiceManager:
             status_info.uptime_seconds = port_forward.get_uptime_seconds()
 
             # Check if process is actually alive
-            if port_forward.is_process_alive():
+            if self._check_alive(port_forward):
                 status_info.is_healthy = True
                 service.update_status(ServiceStatus.RUNNING)
                 status_info.status = ServiceStatus.RUNNING
@@ -409,16 +528,20 @@ class ServiceManager:
         Returns:
             List of ServiceStatusInfo objects
         """
+        # Status checks are independent I/O-bound operations, so run them
+        # concurrently; wall time becomes the slowest check rather than the sum.
+        results = await asyncio.gather(
+            *(self.get_service_status(service) for service in services),
+            return_exceptions=True
+        )
+
         status_list = []
 
-        for service in services:
-            try:
-                status = await self.get_service_status(service)
-                status_list.append(status)
-            except Exception as e:
+        for service, result in zip(services, results):
+            if isinstance(result, BaseException):
                 logger.error("Error getting service status",
                            service_name=service.name,
-                           error=str(e))
+                           error=str(result))
                 # Create a basic status with error state
                 status_list.append(ServiceStatusInfo(
                     id=service.id,
@@ -427,10 +550,12 @@ class ServiceManager:
                     local_port=service.local_port,
                     remote_port=service.remote_port,
                     status=ServiceStatus.FAILED,
-                    tags=service.tags.copy(),
+                    tags=service.tags_ordered(),
                     description=service.description,
                     is_healthy=False
                 ))
+            else:
+                status_list.append(result)
 
         return status_list
 
@@ -440,22 +565,23 @@ class ServiceManager:
         Returns:
             Number of dead processes cleaned up
         """
-        logger.info("Cleaning up dead processes")
-
-        dead_services = []
-
-        for service_id, port_forward in self._active_forwards.items():
-            if not port_forward.is_process_alive():
-                dead_services.append(service_id)
-                logger.info("Found dead process",
-                           service_id=service_id,
-                           process_id=port_forward.process_id)
+        dead_services = [
+            service_id
+            for service_id, port_forward in list(self._active_forwards.items())
+            if not self._check_alive(port_forward)
+        ]
 
-        # Remove dead processes
+        dead_pids = []
         for service_id in dead_services:
-            del self._active_forwards[service_id]
-
-        logger.info("Cleaned up dead processes", count=len(dead_services))
+            port_forward = self._active_forwards.pop(service_id, None)
+            if port_forward is not None:
+                dead_pids.append(port_forward.process_id)
+                self._forget_alive(port_forward.process_id)
+
+        logger.info("Cleaned up dead processes",
+                   count=len(dead_services),
+                   service_ids=[str(service_id) for service_id in dead_services],
+                   process_ids=dead_pids)
         return len(dead_services)
 
     async def stop_all_services(self, services: list[Service]) -> list[ServiceStopResult]:
@@ -469,20 +595,26 @@ class ServiceManager:
         """
         logger.info("Stopping all services", count=len(services))
 
+        # Stops are independent subprocess teardowns; run them concurrently so
+        # mass-stop takes the slowest stop rather than the sum of all stops.
+        raw_results = await asyncio.gather(
+            *(self.stop_service(service) for service in services),
+            return_exceptions=True
+        )
+
         results = []
 
-        for service in services:
-            try:
-                result = await self.stop_service(service)
-                results.append(result)
-            except Exception as e:
+        for service, result in zip(services, raw_results):
+            if isinstance(result, BaseException):
                 logger.error("Error stopping service",
                            service_name=service.name,
-                           error=str(e))
+                           error=str(result))
                 results.append(ServiceStopResult.failure_result(
                     service.name,
-                    str(e)
+                    str(result)
                 ))
+            else:
+                results.append(result)
 
         return results
 
@@ -490,13 +622,19 @@ class ServiceManager:
         """Clean up all active port forward processes."""
         logger.info("Cleaning up all processes", count=len(self._active_forwards))
 
-        for technology, adapter in self._adapters.items():
-            try:
-                await adapter.cleanup_all_processes()
-            except Exception as e:
+        # Adapter cleanups are independent; run them concurrently.
+        technologies = list(self._adapters.keys())
+        results = await asyncio.gather(
+            *(self._adapters[technology].cleanup_all_processes()
+              for technology in technologies),
+            return_exceptions=True
+        )
+
+        for technology, result in zip(technologies, results):
+            if isinstance(result, BaseException):
                 logger.error("Error cleaning up adapter processes",
                            technology=technology.value,
-                           error=str(e))
+                           error=str(result))
 
         self._active_forwards.clear()
         logger.info("All processes cleaned up")
@@ -521,7 +659,7 @@ class ServiceManager:
         for service_id, port_forward in self._active_forwards.items():
             if service_id not in declared_service_ids:
                 # This process is in our state but not in current config
-                if port_forward.is_process_alive():
+                if self._check_alive(port_forward):
                     try:
                         proc = psutil.Process(port_forward.process_id)
                         cmdline = ' '.join(proc.cmdline()) if proc.cmdline() else proc.name()
@@ -573,7 +711,7 @@ class ServiceManager:
                 
                 # Stop the process using the appropriate adapter
                 # For now, assume kubectl (could be enhanced to detect technology)
-                adapter = self._adapters[ForwardingTechnology.KUBECTL]
+                adapter = self._adapter_for(ForwardingTechnology.KUBECTL)
                 await adapter.stop_port_forward(process_id)
                 
                 # Remove from active forwards
@@ -610,6 +748,48 @@ class ServiceManager:
         """
         return await self._tcp_health_check.check_port_available(port)
 
+    async def are_ports_available(self, ports: list[int]) -> dict[int, bool]:
+        """Probe several local ports for availability concurrently.
+
+        Batch callers (e.g. bulk start) use this to screen all candidate
+        ports in one pass instead of probing serially per service.
+
+        Args:
+            ports: Port numbers to probe
+
+        Returns:
+            Dictionary mapping each port to True if it is available
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, self._probe_port, port) for port in ports)
+        )
+        return dict(zip(ports, results))
+
+    @staticmethod
+    def _probe_port(port: int) -> bool:
+        """Blocking bind/listen probe behind are_ports_available.
+
+        SO_REUSEADDR avoids false positives from ports lingering in
+        TIME_WAIT; listen() confirms the port can actually be claimed.
+
+        Args:
+            port: Port number to probe
+
+        Returns:
+            True if the port is available, False if in use
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("localhost", port))
+            sock.listen(1)
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
     async def _get_port_conflict_info(self, port: int) -> dict | None:
         """Get detailed information about what's using a port.
 
@@ -668,13 +848,13 @@ class ServiceManager:
         """
         return len(self._active_forwards)
 
-    def get_active_forwards(self) -> dict[UUID, PortForward]:
+    def get_active_forwards(self) -> Mapping[UUID, PortForward]:
         """Get all active port forwards.
 
         Returns:
-            Dictionary of active port forwards by service ID
+            Read-only view of active port forwards by service ID
         """
-        return self._active_forwards.copy()
+        return MappingProxyType(self._active_forwards)
 
     def _get_state_file_path(self) -> Path:
         """Get platform-appropriate state file location.
@@ -796,7 +976,8 @@ class ServiceManager:
                         process_id=port_forward.process_id,
                         local_port=port_forward.local_port,
                         remote_port=port_forward.remote_port,
-                        started_at=port_forward.started_at
+                        started_at=port_forward.started_at,
+                        monotonic_started_at=port_forward.monotonic_started_at
                     )
                     migrated_forward.restart_count = port_forward.restart_count
                     migrated_forward.last_health_check = port_forward.last_health_check
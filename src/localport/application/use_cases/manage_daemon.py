@@ -9,7 +9,7 @@ from ...domain.repositories.service_repository import ServiceRepository
 from ..dto.service_dto import DaemonOperationResult, DaemonStatusResult
 from ..services.service_manager import ServiceManager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class DaemonCommand(str, Enum):
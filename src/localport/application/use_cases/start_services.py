@@ -9,10 +9,14 @@ from ...domain.repositories.service_repository import (
     ServiceNotFoundError,
     ServiceRepository,
 )
-from ..dto.service_dto import BulkOperationResult, ServiceStartResult
+from ..dto.service_dto import (
+    BulkOperationResult,
+    ServiceStartResult,
+    batch_timestamp,
+)
 from ..services.service_manager import ServiceManager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 @dataclass
@@ -57,8 +61,8 @@ class StartServicesUseCase:
                 return BulkOperationResult(
                     operation="start",
                     total_services=0,
-                    successful_services=[],
-                    failed_services=[],
+                    successful_services=set(),
+                    failed_services=set(),
                     errors={}
                 )
 
@@ -66,34 +70,45 @@ class StartServicesUseCase:
                        count=len(services),
                        service_names=[s.name for s in services])
 
+            # Screen all candidate ports in one concurrent pass so each
+            # start only re-probes ports that looked busy up front.
+            port_availability = await self._service_manager.are_ports_available(
+                [service.local_port for service in services]
+            )
+
             # Start each service
-            successful_services = []
-            failed_services = []
+            successful_services = set()
+            failed_services = set()
             errors = {}
 
-            for service in services:
-                try:
-                    result = await self._start_single_service(service, command)
-
-                    if result.success:
-                        successful_services.append(service.name)
-                        logger.info("Service started successfully",
-                                   service_name=service.name,
-                                   process_id=result.process_id)
-                    else:
-                        failed_services.append(service.name)
-                        errors[service.name] = result.error or "Unknown error"
-                        logger.error("Service failed to start",
+            with batch_timestamp():
+                for service in services:
+                    try:
+                        result = await self._start_single_service(
+                            service,
+                            command,
+                            port_known_free=port_availability.get(service.local_port, False)
+                        )
+
+                        if result.success:
+                            successful_services.add(service.name)
+                            logger.info("Service started successfully",
+                                       service_name=service.name,
+                                       process_id=result.process_id)
+                        else:
+                            failed_services.add(service.name)
+                            errors[service.name] = result.error or "Unknown error"
+                            logger.error("Service failed to start",
+                                        service_name=service.name,
+                                        error=result.error)
+
+                    except Exception as e:
+                        failed_services.add(service.name)
+                        error_msg = str(e)
+                        errors[service.name] = error_msg
+                        logger.error("Unexpected error starting service",
                                     service_name=service.name,
-                                    error=result.error)
-
-                except Exception as e:
-                    failed_services.append(service.name)
-                    error_msg = str(e)
-                    errors[service.name] = error_msg
-                    logger.error("Unexpected error starting service",
-                                service_name=service.name,
-                                error=error_msg)
+                                    error=error_msg)
 
             # Create result
             result = BulkOperationResult(
@@ -157,13 +172,16 @@ class StartServicesUseCase:
     async def _start_single_service(
         self,
         service: Service,
-        command: StartServicesCommand
+        command: StartServicesCommand,
+        port_known_free: bool = False
     ) -> ServiceStartResult:
         """Start a single service.
 
         Args:
             service: Service to start
             command: Command with additional options
+            port_known_free: Whether a batch probe already confirmed the
+                local port is available
 
         Returns:
             ServiceStartResult with the outcome
@@ -185,7 +203,10 @@ class StartServicesUseCase:
                 await self._service_manager.stop_service(service)
 
             # Start the service
-            result = await self._service_manager.start_service(service)
+            result = await self._service_manager.start_service(
+                service,
+                skip_port_check=port_known_free
+            )
 
             # Wait for health check if requested
             if command.wait_for_health and result.success:
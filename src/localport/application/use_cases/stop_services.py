@@ -9,10 +9,14 @@ from ...domain.repositories.service_repository import (
     ServiceNotFoundError,
     ServiceRepository,
 )
-from ..dto.service_dto import BulkOperationResult, ServiceStopResult
+from ..dto.service_dto import (
+    BulkOperationResult,
+    ServiceStopResult,
+    batch_timestamp,
+)
 from ..services.service_manager import ServiceManager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 @dataclass
@@ -56,8 +60,8 @@ class StopServicesUseCase:
                 return BulkOperationResult(
                     operation="stop",
                     total_services=0,
-                    successful_services=[],
-                    failed_services=[],
+                    successful_services=set(),
+                    failed_services=set(),
                     errors={}
                 )
 
@@ -66,32 +70,33 @@ class StopServicesUseCase:
                        service_names=[s.name for s in services])
 
             # Stop each service
-            successful_services = []
-            failed_services = []
+            successful_services = set()
+            failed_services = set()
             errors = {}
 
-            for service in services:
-                try:
-                    result = await self._stop_single_service(service, command)
-
-                    if result.success:
-                        successful_services.append(service.name)
-                        logger.info("Service stopped successfully",
-                                   service_name=service.name)
-                    else:
-                        failed_services.append(service.name)
-                        errors[service.name] = result.error or "Unknown error"
-                        logger.error("Service failed to stop",
+            with batch_timestamp():
+                for service in services:
+                    try:
+                        result = await self._stop_single_service(service, command)
+
+                        if result.success:
+                            successful_services.add(service.name)
+                            logger.info("Service stopped successfully",
+                                       service_name=service.name)
+                        else:
+                            failed_services.add(service.name)
+                            errors[service.name] = result.error or "Unknown error"
+                            logger.error("Service failed to stop",
+                                        service_name=service.name,
+                                        error=result.error)
+
+                    except Exception as e:
+                        failed_services.add(service.name)
+                        error_msg = str(e)
+                        errors[service.name] = error_msg
+                        logger.error("Unexpected error stopping service",
                                     service_name=service.name,
-                                    error=result.error)
-
-                except Exception as e:
-                    failed_services.append(service.name)
-                    error_msg = str(e)
-                    errors[service.name] = error_msg
-                    logger.error("Unexpected error stopping service",
-                                service_name=service.name,
-                                error=error_msg)
+                                    error=error_msg)
 
             # Create result
             result = BulkOperationResult(
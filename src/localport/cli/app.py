@@ -1,5 +1,6 @@
 """Main CLI application using Typer and Rich."""
 
+import functools
 import os
 import sys
 
@@ -15,7 +16,7 @@ from .utils.rich_utils import setup_rich_logging
 
 # Initialize console and logger
 console = Console()
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 # Create main Typer app
 app = typer.Typer(
@@ -27,28 +28,49 @@ app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]}
 )
 
-# Global settings instance
-settings: Settings | None = None
+# Verbosity level -> (log level, verbose flag), resolved once at import
+# instead of a branch chain on every invocation.
+_VERBOSITY_MAP = {
+    -1: ("ERROR", False),   # Quiet
+    0: ("WARNING", False),  # Clean (default)
+    1: ("INFO", True),      # Informational
+    2: ("DEBUG", True),     # Debug
+}
+
+# Lowercased format string -> OutputFormat member
+_OUTPUT_MAP = {fmt.value: fmt for fmt in OutputFormat}
+
+
+def _resolve_verbosity_level(verbosity_count: int, debug_flag: bool, quiet_flag: bool) -> int:
+    """Resolve final verbosity level from flags."""
+    if quiet_flag:
+        return -1  # Quiet mode: errors only
+    if debug_flag:
+        return 2   # Debug level
+    return min(verbosity_count, 2)  # Cap at debug level
+
+
+@functools.cache
+def _version_panel() -> Panel:
+    """Build the version display panel once; the version never changes."""
+    from .. import __version__
+
+    version_text = Text()
+    version_text.append("LocalPort ", style="bold blue")
+    version_text.append(f"v{__version__}", style="bold green")
+
+    return Panel(
+        version_text,
+        title="[bold]Version Information[/bold]",
+        border_style="blue",
+        padding=(1, 2)
+    )
 
 
 def version_callback(value: bool):
     """Show version information."""
     if value:
-        from .. import __version__
-
-        # Create a rich version display
-        version_text = Text()
-        version_text.append("LocalPort ", style="bold blue")
-        version_text.append(f"v{__version__}", style="bold green")
-
-        panel = Panel(
-            version_text,
-            title="[bold]Version Information[/bold]",
-            border_style="blue",
-            padding=(1, 2)
-        )
-
-        console.print(panel)
+        console.print(_version_panel())
         raise typer.Exit()
 
 
@@ -146,8 +168,6 @@ def main(
     • [blue]Configuration Guide:[/blue] https://github.com/dawsonlp/localport/blob/main/docs/configuration.md
     • [blue]Report Issues:[/blue] https://github.com/dawsonlp/localport/issues
     """
-    global settings
-
     # Initialize context object
     ctx.ensure_object(dict)
 
@@ -156,36 +176,15 @@ def main(
         console._color_system = None
         os.environ["NO_COLOR"] = "1"
 
-    # Resolve verbosity level from flags
-    def resolve_verbosity_level(verbosity_count: int, debug_flag: bool, quiet_flag: bool) -> int:
-        """Resolve final verbosity level from flags."""
-        if quiet_flag:
-            return -1  # Quiet mode: errors only
-        if debug_flag:
-            return 2   # Debug level
-        return min(verbosity_count, 2)  # Cap at debug level
-
-    verbosity_level = resolve_verbosity_level(verbose, debug, quiet)
-
-    # Map verbosity level to log level for backward compatibility
-    if verbosity_level == -1:  # Quiet
-        log_level = "ERROR"
-        verbose_bool = False
-    elif verbosity_level == 0:  # Clean (default)
-        log_level = "WARNING"
-        verbose_bool = False
-    elif verbosity_level == 1:  # Informational
-        log_level = "INFO"
-        verbose_bool = True
-    else:  # verbosity_level >= 2, Debug
-        log_level = "DEBUG"
-        verbose_bool = True
+    # Resolve verbosity level from flags, then map it to a log level for
+    # backward compatibility
+    verbosity_level = _resolve_verbosity_level(verbose, debug, quiet)
+    log_level, verbose_bool = _VERBOSITY_MAP[verbosity_level]
 
     # Validate output format
-    try:
-        output_format = OutputFormat.from_string(output)
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] Invalid log level '{log_level}'. Valid levels: table, json, text")
+    output_format = _OUTPUT_MAP.get(output.lower())
+    if output_format is None:
+        console.print(f"[red]Error:[/red] Invalid output format '{output}'. Valid formats: table, json, text")
         raise typer.Exit(1)
 
     # Setup logging with verbosity level
@@ -260,75 +259,46 @@ from .commands.cluster_commands import (
     cluster_pods_sync,
 )
 
-# Service management commands
-app.command(name="start")(start_services_sync)
-app.command(name="stop")(stop_services_sync)
-app.command(name="status")(status_services_sync)
-app.command(name="logs")(logs_sync)
-
-
-# Daemon command group
-daemon_app = typer.Typer(
-    name="daemon",
-    help="Daemon management commands",
-    no_args_is_help=True
-)
-
-# Add daemon commands
-daemon_app.command(name="start")(start_daemon_sync)
-daemon_app.command(name="stop")(stop_daemon_sync)
-daemon_app.command(name="restart")(restart_daemon_sync)
-daemon_app.command(name="status")(status_daemon_sync)
-daemon_app.command(name="reload")(reload_daemon_sync)
-
-# Add daemon subcommand
-app.add_typer(daemon_app, name="daemon")
-
-
-# Config command group
-config_app = typer.Typer(
-    name="config",
-    help="Configuration management commands",
-    no_args_is_help=True
-)
-
-# Add config commands
-config_app.command(name="export")(export_config_sync)
-config_app.command(name="validate")(validate_config_sync)
-
-# Add config subcommand
-app.add_typer(config_app, name="config")
-
-
-# SSH command group
-ssh_app = typer.Typer(
-    name="ssh",
-    help="SSH-specific commands",
-    no_args_is_help=True
-)
-
-# Add SSH commands
-ssh_app.command(name="test")(test_ssh_connectivity_sync)
-ssh_app.command(name="validate")(validate_ssh_config_sync)
-
-# Add SSH subcommand
-app.add_typer(ssh_app, name="ssh")
-
-
-# Cluster command group
-cluster_app = typer.Typer(
-    name="cluster",
-    help="Cluster health monitoring commands",
-    no_args_is_help=True
-)
-
-# Add cluster commands
-cluster_app.command(name="status")(cluster_status_sync)
-cluster_app.command(name="events")(cluster_events_sync)
-cluster_app.command(name="pods")(cluster_pods_sync)
-
-# Add cluster subcommand
-app.add_typer(cluster_app, name="cluster")
+# Root-level service management commands
+_ROOT_COMMANDS = [
+    ("start", start_services_sync),
+    ("stop", stop_services_sync),
+    ("status", status_services_sync),
+    ("logs", logs_sync),
+]
+
+# Command groups: group name -> (help text, [(command name, handler), ...])
+_COMMAND_GROUPS = {
+    "daemon": ("Daemon management commands", [
+        ("start", start_daemon_sync),
+        ("stop", stop_daemon_sync),
+        ("restart", restart_daemon_sync),
+        ("status", status_daemon_sync),
+        ("reload", reload_daemon_sync),
+    ]),
+    "config": ("Configuration management commands", [
+        ("export", export_config_sync),
+        ("validate", validate_config_sync),
+    ]),
+    "ssh": ("SSH-specific commands", [
+        ("test", test_ssh_connectivity_sync),
+        ("validate", validate_ssh_config_sync),
+    ]),
+    "cluster": ("Cluster health monitoring commands", [
+        ("status", cluster_status_sync),
+        ("events", cluster_events_sync),
+        ("pods", cluster_pods_sync),
+    ]),
+}
+
+for _name, _handler in _ROOT_COMMANDS:
+    app.command(name=_name)(_handler)
+
+for _group_name, (_help, _commands) in _COMMAND_GROUPS.items():
+    _group_app = typer.Typer(name=_group_name, help=_help, no_args_is_help=True)
+    for _name, _handler in _commands:
+        _group_app.command(name=_name)(_handler)
+    app.add_typer(_group_app, name=_group_name)
 
 
 def cli_main():
@@ -1,6 +1,5 @@
 """Cluster management commands for LocalPort CLI."""
 
-import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -11,16 +10,15 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from ...application.services.cluster_health_manager import ClusterHealthManager
-from ...infrastructure.repositories.yaml_config_repository import YamlConfigRepository
 from ..formatters.format_router import FormatRouter
 from ..formatters.output_format import OutputFormat
+from ..utils.async_utils import run_async
 from ..utils.rich_utils import (
     create_error_panel,
     create_success_panel,
 )
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 console = Console()
 
 
@@ -39,6 +37,10 @@ async def _get_cluster_health_data() -> dict | None:
             return None
 
         # Load configuration
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
+
         config_repo = YamlConfigRepository(str(config_path))
         config = await config_repo.load_configuration()
         
@@ -509,7 +511,7 @@ def cluster_status_sync(
 ) -> None:
     """Show detailed cluster health information."""
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(cluster_status_command(context, output_format))
+    run_async(cluster_status_command(context, output_format))
 
 
 def cluster_events_sync(
@@ -520,7 +522,7 @@ def cluster_events_sync(
 ) -> None:
     """Show recent cluster events that might affect services."""
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(cluster_events_command(context, since, limit, output_format))
+    run_async(cluster_events_command(context, since, limit, output_format))
 
 
 def cluster_pods_sync(
@@ -530,4 +532,4 @@ def cluster_pods_sync(
 ) -> None:
     """Show pod status for resources used by active services."""
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(cluster_pods_command(context, namespace, output_format))
+    run_async(cluster_pods_command(context, namespace, output_format))
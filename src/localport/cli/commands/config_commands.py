@@ -1,6 +1,5 @@
 """Configuration management commands for LocalPort CLI."""
 
-import asyncio
 import json
 from pathlib import Path
 
@@ -10,15 +9,15 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 
-from ...infrastructure.repositories.yaml_config_repository import YamlConfigRepository
 from ..formatters.output_format import OutputFormat
+from ..utils.async_utils import run_async
 from ..utils.rich_utils import (
     create_error_panel,
     create_info_panel,
     create_success_panel,
 )
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 console = Console()
 
 
@@ -34,6 +33,10 @@ async def export_config_command(
     """Export LocalPort configuration to different formats."""
     try:
         # Load current configuration
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
+
         config_repo = YamlConfigRepository()
 
         # Try to find existing config file
@@ -65,6 +68,10 @@ async def export_config_command(
             return
 
         # Load configuration
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
+
         config_repo = YamlConfigRepository(config_path)
         config_data = await config_repo.load_configuration()
 
@@ -212,6 +219,10 @@ async def validate_config_command(
             raise typer.Exit(1)
 
         # Validate configuration
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
+
         config_repo = YamlConfigRepository(config_path)
         config_data = await config_repo.load_configuration()
 
@@ -375,7 +386,7 @@ def export_config_sync(
     """
     # Get output format from context
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(export_config_command(output_file, format, include_defaults, include_disabled, services, tags, output_format))
+    run_async(export_config_command(output_file, format, include_defaults, include_disabled, services, tags, output_format))
 
 
 def validate_config_sync(
@@ -391,4 +402,4 @@ def validate_config_sync(
     """
     # Get output format from context
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(validate_config_command(config_file, output_format))
+    run_async(validate_config_command(config_file, output_format))
@@ -1,23 +1,14 @@
 """Daemon management commands for LocalPort CLI."""
 
 import asyncio
+from typing import TYPE_CHECKING
 
 import structlog
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from ...application.services.daemon_manager import DaemonManager
-from ...application.services.health_monitor_scheduler import HealthMonitorScheduler
-from ...application.services.restart_manager import RestartManager
-from ...application.services.service_manager import ServiceManager
-from ...application.use_cases.manage_daemon import ManageDaemonUseCase
-from ...infrastructure.adapters.adapter_factory import AdapterFactory
-from ...infrastructure.health_checks.health_check_factory import HealthCheckFactory
-from ...infrastructure.repositories.memory_service_repository import (
-    MemoryServiceRepository,
-)
-from ...infrastructure.repositories.yaml_config_repository import YamlConfigRepository
+from ..utils.async_utils import run_async
 from ..utils.progress_utils import EnhancedProgress, get_operation_messages
 from ..utils.rich_utils import (
     create_error_panel,
@@ -26,10 +17,62 @@ from ..utils.rich_utils import (
     format_uptime,
 )
 
-logger = structlog.get_logger()
+if TYPE_CHECKING:
+    from ...application.use_cases.manage_daemon import ManageDaemonUseCase
+
+logger = structlog.get_logger(__name__)
 console = Console()
 
 
+def _build_daemon_use_case() -> "ManageDaemonUseCase":
+    """Build the daemon use case, importing the runtime stack lazily.
+
+    Command modules load on every CLI invocation, so the application and
+    infrastructure stack is only imported once a daemon command runs.
+
+    Returns:
+        A fully wired ManageDaemonUseCase
+    """
+    from ...application.services.daemon_manager import DaemonManager
+    from ...application.services.health_monitor_scheduler import (
+        HealthMonitorScheduler,
+    )
+    from ...application.services.restart_manager import RestartManager
+    from ...application.services.service_manager import ServiceManager
+    from ...application.use_cases.manage_daemon import ManageDaemonUseCase
+    from ...infrastructure.adapters.adapter_factory import AdapterFactory
+    from ...infrastructure.health_checks.health_check_factory import (
+        HealthCheckFactory,
+    )
+    from ...infrastructure.repositories.memory_service_repository import (
+        MemoryServiceRepository,
+    )
+    from ...infrastructure.repositories.yaml_config_repository import (
+        YamlConfigRepository,
+    )
+
+    service_repo = MemoryServiceRepository()
+    config_repo = YamlConfigRepository()
+    AdapterFactory()
+    health_check_factory = HealthCheckFactory()
+
+    service_manager = ServiceManager()
+    restart_manager = RestartManager(service_manager)
+    health_monitor = HealthMonitorScheduler(health_check_factory, restart_manager)
+
+    DaemonManager(
+        service_repository=service_repo,
+        config_repository=config_repo,
+        service_manager=service_manager,
+        health_monitor=health_monitor
+    )
+
+    return ManageDaemonUseCase(
+        service_repository=service_repo,
+        service_manager=service_manager
+    )
+
+
 async def start_daemon_command(
     config_file: str | None = None,
     auto_start: bool = True,
@@ -37,28 +80,8 @@ async def start_daemon_command(
 ) -> None:
     """Start the LocalPort daemon."""
     try:
-        # Initialize repositories and services
-        service_repo = MemoryServiceRepository()
-        config_repo = YamlConfigRepository()
-        AdapterFactory()
-        health_check_factory = HealthCheckFactory()
-
-        service_manager = ServiceManager()
-        restart_manager = RestartManager(service_manager)
-        health_monitor = HealthMonitorScheduler(health_check_factory, restart_manager)
-
-        DaemonManager(
-            service_repository=service_repo,
-            config_repository=config_repo,
-            service_manager=service_manager,
-            health_monitor=health_monitor
-        )
-
-        # Initialize use case
-        daemon_use_case = ManageDaemonUseCase(
-            service_repository=service_repo,
-            service_manager=service_manager
-        )
+        # Initialize use case (imports the runtime stack lazily)
+        daemon_use_case = _build_daemon_use_case()
 
         # Start daemon with enhanced progress indication
         enhanced_progress = EnhancedProgress(console)
@@ -152,28 +175,8 @@ async def start_daemon_command(
 async def stop_daemon_command(force: bool = False) -> None:
     """Stop the LocalPort daemon."""
     try:
-        # Initialize minimal setup for daemon management
-        service_repo = MemoryServiceRepository()
-        config_repo = YamlConfigRepository()
-        AdapterFactory()
-        health_check_factory = HealthCheckFactory()
-
-        service_manager = ServiceManager()
-        restart_manager = RestartManager(service_manager)
-        health_monitor = HealthMonitorScheduler(health_check_factory, restart_manager)
-
-        DaemonManager(
-            service_repository=service_repo,
-            config_repository=config_repo,
-            service_manager=service_manager,
-            health_monitor=health_monitor
-        )
-
-        # Initialize use case
-        daemon_use_case = ManageDaemonUseCase(
-            service_repository=service_repo,
-            service_manager=service_manager
-        )
+        # Initialize use case (imports the runtime stack lazily)
+        daemon_use_case = _build_daemon_use_case()
 
         # Stop daemon with enhanced progress indication
         enhanced_progress = EnhancedProgress(console)
@@ -230,28 +233,8 @@ async def restart_daemon_command(
 ) -> None:
     """Restart the LocalPort daemon."""
     try:
-        # Initialize repositories and services
-        service_repo = MemoryServiceRepository()
-        config_repo = YamlConfigRepository()
-        AdapterFactory()
-        health_check_factory = HealthCheckFactory()
-
-        service_manager = ServiceManager()
-        restart_manager = RestartManager(service_manager)
-        health_monitor = HealthMonitorScheduler(health_check_factory, restart_manager)
-
-        DaemonManager(
-            service_repository=service_repo,
-            config_repository=config_repo,
-            service_manager=service_manager,
-            health_monitor=health_monitor
-        )
-
-        # Initialize use case
-        daemon_use_case = ManageDaemonUseCase(
-            service_repository=service_repo,
-            service_manager=service_manager
-        )
+        # Initialize use case (imports the runtime stack lazily)
+        daemon_use_case = _build_daemon_use_case()
 
         # Restart daemon with enhanced progress indication
         enhanced_progress = EnhancedProgress(console)
@@ -306,28 +289,8 @@ async def restart_daemon_command(
 async def status_daemon_command(watch: bool = False, refresh_interval: int = 5) -> None:
     """Show daemon status."""
     try:
-        # Initialize minimal setup for daemon management
-        service_repo = MemoryServiceRepository()
-        config_repo = YamlConfigRepository()
-        AdapterFactory()
-        health_check_factory = HealthCheckFactory()
-
-        service_manager = ServiceManager()
-        restart_manager = RestartManager(service_manager)
-        health_monitor = HealthMonitorScheduler(health_check_factory, restart_manager)
-
-        DaemonManager(
-            service_repository=service_repo,
-            config_repository=config_repo,
-            service_manager=service_manager,
-            health_monitor=health_monitor
-        )
-
-        # Initialize use case
-        daemon_use_case = ManageDaemonUseCase(
-            service_repository=service_repo,
-            service_manager=service_manager
-        )
+        # Initialize use case (imports the runtime stack lazily)
+        daemon_use_case = _build_daemon_use_case()
 
         async def show_status():
             """Show current daemon status."""
@@ -371,7 +334,8 @@ async def status_daemon_command(watch: bool = False, refresh_interval: int = 5)
                 table.add_row("Status", "[red]Stopped[/red]")
                 table.add_row("Message", result.message or "Daemon is not running")
 
-            console.clear() if watch else None
+            if watch:
+                console.clear()
             console.print(table)
 
             # Show additional info
@@ -406,28 +370,8 @@ async def status_daemon_command(watch: bool = False, refresh_interval: int = 5)
 async def reload_daemon_command() -> None:
     """Reload daemon configuration."""
     try:
-        # Initialize minimal setup for daemon management
-        service_repo = MemoryServiceRepository()
-        config_repo = YamlConfigRepository()
-        AdapterFactory()
-        health_check_factory = HealthCheckFactory()
-
-        service_manager = ServiceManager()
-        restart_manager = RestartManager(service_manager)
-        health_monitor = HealthMonitorScheduler(health_check_factory, restart_manager)
-
-        DaemonManager(
-            service_repository=service_repo,
-            config_repository=config_repo,
-            service_manager=service_manager,
-            health_monitor=health_monitor
-        )
-
-        # Initialize use case
-        daemon_use_case = ManageDaemonUseCase(
-            service_repository=service_repo,
-            service_manager=service_manager
-        )
+        # Initialize use case (imports the runtime stack lazily)
+        daemon_use_case = _build_daemon_use_case()
 
         # Reload daemon configuration with enhanced progress indication
         enhanced_progress = EnhancedProgress(console)
@@ -484,14 +428,14 @@ def start_daemon_sync(
     """Start the LocalPort daemon."""
     # Invert the logic: default is detached (background), --foreground runs in foreground
     detach = not foreground
-    asyncio.run(start_daemon_command(config_file, auto_start, detach))
+    run_async(start_daemon_command(config_file, auto_start, detach))
 
 
 def stop_daemon_sync(
     force: bool = typer.Option(False, "--force", "-f", help="Force stop daemon")
 ) -> None:
     """Stop the LocalPort daemon."""
-    asyncio.run(stop_daemon_command(force))
+    run_async(stop_daemon_command(force))
 
 
 def restart_daemon_sync(
@@ -499,7 +443,7 @@ def restart_daemon_sync(
     force: bool = typer.Option(False, "--force", "-f", help="Force restart daemon")
 ) -> None:
     """Restart the LocalPort daemon."""
-    asyncio.run(restart_daemon_command(config_file, force))
+    run_async(restart_daemon_command(config_file, force))
 
 
 def status_daemon_sync(
@@ -507,9 +451,9 @@ def status_daemon_sync(
     refresh_interval: int = typer.Option(5, "--interval", "-i", help="Refresh interval in seconds for watch mode")
 ) -> None:
     """Show daemon status."""
-    asyncio.run(status_daemon_command(watch, refresh_interval))
+    run_async(status_daemon_command(watch, refresh_interval))
 
 
 def reload_daemon_sync() -> None:
     """Reload daemon configuration."""
-    asyncio.run(reload_daemon_command())
+    run_async(reload_daemon_command())
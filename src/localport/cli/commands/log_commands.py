@@ -12,10 +12,10 @@ from rich.table import Table
 
 from ..formatters.format_router import FormatRouter
 from ..formatters.output_format import OutputFormat
+from ..utils.async_utils import run_async
 from ..utils.rich_utils import create_error_panel, create_info_panel
-from ...infrastructure.logging.service_log_manager import get_service_log_manager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 console = Console()
 
 
@@ -426,17 +426,21 @@ def logs_sync(
     
     # Handle new service logging commands
     if list_services:
-        asyncio.run(list_service_logs_command(output_format))
+        run_async(list_service_logs_command(output_format))
         return
     
     if location:
-        asyncio.run(show_log_location_command(output_format))
+        run_async(show_log_location_command(output_format))
         return
     
     if service:
         if path:
             # Show service log file path
             try:
+                from ...infrastructure.logging.service_log_manager import (
+                    get_service_log_manager,
+                )
+
                 service_log_manager = get_service_log_manager()
                 service_logs = service_log_manager.list_service_logs()
                 
@@ -488,11 +492,11 @@ def logs_sync(
                 raise typer.Exit(1)
         else:
             # Show service logs
-            asyncio.run(show_service_log_command(service, lines, follow, grep, output_format))
+            run_async(show_service_log_command(service, lines, follow, grep, output_format))
         return
     
     # Default behavior: show daemon logs (backward compatibility)
-    asyncio.run(logs_command(services, level, since, until, follow, lines, grep, output_format))
+    run_async(logs_command(services, level, since, until, follow, lines, grep, output_format))
 
 
 # New service logging commands for v0.3.4
@@ -500,6 +504,10 @@ def logs_sync(
 async def list_service_logs_command(output_format: OutputFormat = OutputFormat.TABLE) -> None:
     """List all available service logs with metadata."""
     try:
+        from ...infrastructure.logging.service_log_manager import (
+            get_service_log_manager,
+        )
+
         service_log_manager = get_service_log_manager()
         service_logs = service_log_manager.list_service_logs()
         
@@ -606,6 +614,10 @@ async def list_service_logs_command(output_format: OutputFormat = OutputFormat.T
 async def show_log_location_command(output_format: OutputFormat = OutputFormat.TABLE) -> None:
     """Show service log directory locations."""
     try:
+        from ...infrastructure.logging.service_log_manager import (
+            get_service_log_manager,
+        )
+
         service_log_manager = get_service_log_manager()
         log_directory = service_log_manager.get_log_directory()
         daemon_log_dir = log_directory.parent
@@ -672,6 +684,10 @@ async def show_service_log_command(
 ) -> None:
     """Show logs for a specific service."""
     try:
+        from ...infrastructure.logging.service_log_manager import (
+            get_service_log_manager,
+        )
+
         service_log_manager = get_service_log_manager()
         service_logs = service_log_manager.list_service_logs()
         
@@ -824,13 +840,13 @@ async def show_service_log_command(
 def list_service_logs_sync(ctx: typer.Context) -> None:
     """List all available service logs with metadata."""
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(list_service_logs_command(output_format))
+    run_async(list_service_logs_command(output_format))
 
 
 def show_log_location_sync(ctx: typer.Context) -> None:
     """Show service log directory locations."""
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(show_log_location_command(output_format))
+    run_async(show_log_location_command(output_format))
 
 
 def show_service_log_sync(
@@ -842,4 +858,4 @@ def show_service_log_sync(
 ) -> None:
     """Show logs for a specific service."""
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(show_service_log_command(service_name, lines, follow, grep, output_format))
+    run_async(show_service_log_command(service_name, lines, follow, grep, output_format))
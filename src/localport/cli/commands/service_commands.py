@@ -1,27 +1,19 @@
 """Service management commands for LocalPort CLI."""
 
 import asyncio
+import functools
+import os
+import sys
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import structlog
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-
-from ...application.services.service_manager import ServiceManager
-from ...application.services.cluster_health_manager import ClusterHealthManager
-from ...application.use_cases.monitor_services import MonitorServicesUseCase
-from ...application.use_cases.start_services import StartServicesUseCase
-from ...application.use_cases.stop_services import StopServicesUseCase
-from ...infrastructure.adapters.adapter_factory import AdapterFactory
-from ...infrastructure.health_checks.health_check_factory import HealthCheckFactory
-from ...infrastructure.repositories.memory_service_repository import (
-    MemoryServiceRepository,
-)
-from ...infrastructure.repositories.yaml_config_repository import YamlConfigRepository
-from ..formatters.format_router import FormatRouter
+
 from ..formatters.output_format import OutputFormat
+from ..utils.async_utils import run_async
 from ..utils.rich_utils import (
     create_error_panel,
     create_success_panel,
@@ -30,9 +22,57 @@ from ..utils.rich_utils import (
     format_technology,
 )
 
-logger = structlog.get_logger()
+if TYPE_CHECKING:
+    from ...infrastructure.repositories.yaml_config_repository import (
+        YamlConfigRepository,
+    )
+
+logger = structlog.get_logger(__name__)
 console = Console()
 
+# Default config discovery locations, expanded once at import. Keep in
+# sync with the "No Configuration Found" error message below.
+_DEFAULT_CFG_PATHS = tuple(
+    os.path.expanduser(p)
+    for p in (
+        "./localport.yaml",
+        "~/.config/localport/config.yaml",
+        "~/.localport.yaml",
+    )
+)
+
+
+@contextmanager
+def _spinner(description: str, output_format: OutputFormat | None = None):
+    """Show a spinner while a bulk operation runs.
+
+    Skipped when stdout is not a terminal or JSON output was requested:
+    Rich Progress spawns a background render thread that is pure
+    overhead when nobody is watching the screen.
+    """
+    if console.is_terminal and output_format != OutputFormat.JSON:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            progress.add_task(description, total=None)
+            yield
+    else:
+        yield
+
+
+# Lazy process-wide singleton: the service manager persists its state
+# between invocations, so there is no reason to rebuild it per command
+# (or per watch tick).
+@functools.lru_cache(maxsize=1)
+def _service_manager():
+    from ...application.services.service_manager import ServiceManager
+
+    return ServiceManager()
+
 
 async def _check_daemon_running() -> bool:
     """Check if LocalPort daemon is currently running."""
@@ -77,12 +117,9 @@ async def start_services_command(
             config_path = Path(config_file)
         else:
             # Use default config discovery
-            config_path = None
-            for path in ["./localport.yaml", "~/.config/localport/config.yaml"]:
-                test_path = Path(path).expanduser()
-                if test_path.exists():
-                    config_path = test_path
-                    break
+            config_path = next(
+                (Path(p) for p in _DEFAULT_CFG_PATHS if os.path.isfile(p)), None
+            )
 
         if not config_path or not config_path.exists():
             # Determine which specific path was attempted if config_file was provided
@@ -104,22 +141,29 @@ async def start_services_command(
                 ))
             raise typer.Exit(1)
 
+        # Application and infrastructure imports are deferred to command
+        # runtime so CLI startup only pays for the command actually invoked.
+        from ...infrastructure.repositories.memory_service_repository import (
+            MemoryServiceRepository,
+        )
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
+
         # Initialize repositories and services with config path
         service_repo = MemoryServiceRepository()
         config_repo = YamlConfigRepository(str(config_path))
-        AdapterFactory()
-        HealthCheckFactory()
-        service_manager = ServiceManager()
+        service_manager = _service_manager()
 
-        # Load services from config
-        await config_repo.load_configuration()
-        
-        # Load services into the service repository
+        # Load services into the service repository (this parses the
+        # config itself; no separate load_configuration pass is needed)
         loaded_services = await config_repo.load_services()
         for service in loaded_services:
             await service_repo.save(service)
 
         # Initialize use case
+        from ...application.use_cases.start_services import StartServicesUseCase
+
         start_use_case = StartServicesUseCase(
             service_repository=service_repo,
             service_manager=service_manager
@@ -140,13 +184,7 @@ async def start_services_command(
             raise typer.Exit(1)
 
         # Start services with progress indication
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Starting services...", total=None)
-
+        with _spinner("Starting services...", output_format):
             # Create command object
             from ...application.use_cases.start_services import StartServicesCommand
             command = StartServicesCommand(
@@ -158,8 +196,6 @@ async def start_services_command(
 
             result = await start_use_case.execute(command)
 
-            progress.update(task, completed=True)
-
         # Display results
         if result.success_count > 0:
             console.print(create_success_panel(
@@ -169,6 +205,8 @@ async def start_services_command(
 
             # Show started services table
             if result.successful_services:
+                from rich.table import Table
+
                 table = Table(title="Started Services")
                 table.add_column("Service", style="bold blue")
                 table.add_column("Technology", style="cyan")
@@ -268,28 +306,33 @@ async def stop_services_command(
             config_path = Path(config_file)
         else:
             # Use default config discovery
-            config_path = None
-            for path in ["./localport.yaml", "~/.config/localport/config.yaml"]:
-                test_path = Path(path).expanduser()
-                if test_path.exists():
-                    config_path = test_path
-                    break
+            config_path = next(
+                (Path(p) for p in _DEFAULT_CFG_PATHS if os.path.isfile(p)), None
+            )
+
+        # Application and infrastructure imports are deferred to command
+        # runtime so CLI startup only pays for the command actually invoked.
+        from ...infrastructure.repositories.memory_service_repository import (
+            MemoryServiceRepository,
+        )
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
 
         # Initialize repositories and services
         service_repo = MemoryServiceRepository()
         config_repo = YamlConfigRepository(str(config_path)) if config_path else None
-        AdapterFactory()
-        HealthCheckFactory()
-        service_manager = ServiceManager()
+        service_manager = _service_manager()
 
         # Load services from config if available
         if config_repo:
-            await config_repo.load_configuration()
             loaded_services = await config_repo.load_services()
             for service in loaded_services:
                 await service_repo.save(service)
 
         # Initialize use case
+        from ...application.use_cases.stop_services import StopServicesUseCase
+
         stop_use_case = StopServicesUseCase(
             service_repository=service_repo,
             service_manager=service_manager
@@ -305,13 +348,7 @@ async def stop_services_command(
             raise typer.Exit(1)
 
         # Stop services with progress indication
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Stopping services...", total=None)
-
+        with _spinner("Stopping services..."):
             # Create command object
             from ...application.use_cases.stop_services import StopServicesCommand
             command = StopServicesCommand(
@@ -322,8 +359,6 @@ async def stop_services_command(
 
             result = await stop_use_case.execute(command)
 
-            progress.update(task, completed=True)
-
         # Display results
         if result.success_count > 0:
             console.print(create_success_panel(
@@ -367,23 +402,26 @@ async def status_services_command(
     """Show service status."""
     try:
         # Load configuration (same logic as start command)
-        config_path = None
-        for path in ["./localport.yaml", "~/.config/localport/config.yaml"]:
-            test_path = Path(path).expanduser()
-            if test_path.exists():
-                config_path = test_path
-                break
+        config_path = next(
+            (Path(p) for p in _DEFAULT_CFG_PATHS if os.path.isfile(p)), None
+        )
+
+        # Application and infrastructure imports are deferred to command
+        # runtime so CLI startup only pays for the command actually invoked.
+        from ...infrastructure.repositories.memory_service_repository import (
+            MemoryServiceRepository,
+        )
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
 
         # Initialize repositories and services
         service_repo = MemoryServiceRepository()
         config_repo = YamlConfigRepository(str(config_path)) if config_path else None
-        AdapterFactory()
-        HealthCheckFactory()
-        service_manager = ServiceManager()
+        service_manager = _service_manager()
 
         # Load services from config if available
         if config_repo:
-            await config_repo.load_configuration()
             loaded_services = await config_repo.load_services()
             
             # Migrate state from random UUIDs to deterministic UUIDs
@@ -395,18 +433,23 @@ async def status_services_command(
                 await service_repo.save(service)
 
         # Initialize use case
+        from ...application.use_cases.monitor_services import (
+            MonitorServicesCommand,
+            MonitorServicesUseCase,
+        )
+
         monitor_use_case = MonitorServicesUseCase(
             service_repository=service_repo,
             service_manager=service_manager
         )
 
         # Initialize format router
+        from ..formatters.format_router import FormatRouter
+
         format_router = FormatRouter(console)
 
         async def show_status():
             """Show current status."""
-            from ...application.use_cases.monitor_services import MonitorServicesCommand
-
             command = MonitorServicesCommand(
                 service_names=services,
                 all_services=services is None
@@ -421,12 +464,10 @@ async def status_services_command(
                 # For JSON output, include cluster health data
                 formatted_output = format_router.format_service_status(result, output_format)
                 # TODO: Enhance JSON formatter to include cluster health
-                console.print(formatted_output)
+                # Machine-readable output goes straight to stdout; Rich
+                # markup parsing is pure overhead for JSON payloads.
+                sys.stdout.write(formatted_output + "\n")
             else:
-                # For table output, clear screen if watching, then show services and cluster health
-                if watch:
-                    console.clear()
-                
                 # Show service status
                 format_router.format_service_status(result, output_format)
                 
@@ -436,23 +477,70 @@ async def status_services_command(
                     _display_cluster_health_section(cluster_health_data)
 
         if watch:
-            # Watch mode - refresh periodically
-            if output_format == OutputFormat.JSON:
-                # For JSON watch mode, output one JSON object per refresh
-                try:
-                    while True:
-                        await show_status()
-                        await asyncio.sleep(refresh_interval)
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Stopped watching[/yellow]")
-            else:
-                # For table watch mode, clear and refresh
+            # Watch mode - refresh periodically. A SIGINT handler sets a
+            # stop event so Ctrl-C interrupts the wait immediately instead
+            # of waiting out the remainder of the refresh interval.
+            import signal
+
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            try:
+                loop.add_signal_handler(signal.SIGINT, stop.set)
+                sigint_handled = True
+            except (NotImplementedError, RuntimeError):
+                # No signal support on this loop/thread; fall back to
+                # KeyboardInterrupt propagation.
+                sigint_handled = False
+
+            async def wait_for_tick() -> bool:
+                """Wait one refresh interval; True when stop was requested."""
                 try:
-                    while True:
+                    await asyncio.wait_for(stop.wait(), timeout=refresh_interval)
+                except TimeoutError:
+                    pass
+                return stop.is_set()
+
+            try:
+                if output_format == OutputFormat.JSON:
+                    # For JSON watch mode, output one JSON object per refresh
+                    while not stop.is_set():
                         await show_status()
-                        await asyncio.sleep(refresh_interval)
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Stopped watching[/yellow]")
+                        if await wait_for_tick():
+                            break
+                else:
+                    # For table watch mode, update the terminal in place
+                    # with a Live display instead of clearing and
+                    # reprinting the whole screen every refresh.
+                    from rich.console import Group
+                    from rich.live import Live
+
+                    async def build_renderable() -> Group:
+                        command = MonitorServicesCommand(
+                            service_names=services,
+                            all_services=services is None
+                        )
+                        result = await monitor_use_case.execute(command)
+                        cluster_health_data = await _get_cluster_health_for_status(config_repo)
+
+                        parts = [format_router.render_service_status(result)]
+                        if cluster_health_data:
+                            parts.append("")  # Add spacing
+                            parts.append(_build_cluster_health_table(cluster_health_data))
+                            parts.append("[dim]💡 Use 'localport cluster status' for detailed cluster information[/dim]")
+                        return Group(*parts)
+
+                    with Live(await build_renderable(), console=console, auto_refresh=False) as live:
+                        while not stop.is_set():
+                            if await wait_for_tick():
+                                break
+                            live.update(await build_renderable())
+                            live.refresh()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                if sigint_handled:
+                    loop.remove_signal_handler(signal.SIGINT)
+            console.print("\n[yellow]Stopped watching[/yellow]")
         else:
             # Single status check
             await show_status()
@@ -485,7 +573,7 @@ def start_services_sync(
     # Get config file and output format from context
     config_file = ctx.obj.get('config_file')
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(start_services_command(services, all_services, tags, config_file, force, output_format))
+    run_async(start_services_command(services, all_services, tags, config_file, force, output_format))
 
 
 def stop_services_sync(
@@ -497,7 +585,7 @@ def stop_services_sync(
     """Stop port forwarding services."""
     # Get config file from context
     config_file = ctx.obj.get('config_file')
-    asyncio.run(stop_services_command(services, all_services, force, config_file))
+    run_async(stop_services_command(services, all_services, force, config_file))
 
 
 def status_services_sync(
@@ -509,10 +597,10 @@ def status_services_sync(
     """Show service status."""
     # Get output format from context
     output_format = ctx.obj.get('output_format', OutputFormat.TABLE)
-    asyncio.run(status_services_command(services, watch, refresh_interval, output_format))
+    run_async(status_services_command(services, watch, refresh_interval, output_format))
 
 
-async def _get_cluster_health_for_status(config_repo: YamlConfigRepository | None) -> dict | None:
+async def _get_cluster_health_for_status(config_repo: "YamlConfigRepository | None") -> dict | None:
     """Get cluster health data for status display (lightweight but proper domain entities)."""
     if not config_repo:
         return None
@@ -608,9 +696,18 @@ async def _get_cluster_health_for_status(config_repo: YamlConfigRepository | Non
 
 def _display_cluster_health_section(cluster_data: dict) -> None:
     """Display cluster health section in status output."""
+    console.print(_build_cluster_health_table(cluster_data))
+
+    # Add helpful note if cluster health is available
+    if cluster_data:
+        console.print("[dim]💡 Use 'localport cluster status' for detailed cluster information[/dim]")
+
+
+def _build_cluster_health_table(cluster_data: dict):
+    """Build the cluster health table for status output."""
     from datetime import datetime
-    from rich.panel import Panel
-    
+    from rich.table import Table
+
     # Create cluster health table
     table = Table(title="🏗️  Cluster Health", show_header=True, header_style="bold blue")
     table.add_column("Context", style="bold blue", width=20)
@@ -689,8 +786,4 @@ def _display_cluster_health_section(cluster_data: dict) -> None:
                 time_str
             )
 
-    console.print(table)
-    
-    # Add helpful note if cluster health is available
-    if cluster_data:
-        console.print("[dim]💡 Use 'localport cluster status' for detailed cluster information[/dim]")
+    return table
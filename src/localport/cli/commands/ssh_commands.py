@@ -1,6 +1,5 @@
 """SSH-specific commands for LocalPort CLI."""
 
-import asyncio
 from pathlib import Path
 
 import structlog
@@ -8,15 +7,14 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from ...infrastructure.adapters.ssh_adapter import SSHAdapter
-from ...infrastructure.repositories.yaml_config_repository import YamlConfigRepository
+from ..utils.async_utils import run_async
 from ..utils.rich_utils import (
     create_error_panel,
     create_success_panel,
     format_service_name,
 )
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 console = Console()
 
 
@@ -30,6 +28,8 @@ async def test_ssh_connectivity_command(
 ) -> None:
     """Test SSH connectivity for a service or connection details."""
     try:
+        from ...infrastructure.adapters.ssh_adapter import SSHAdapter
+
         ssh_adapter = SSHAdapter()
         
         # Determine connection info source
@@ -55,6 +55,10 @@ async def test_ssh_connectivity_command(
                 raise typer.Exit(1)
 
             # Load service configuration
+            from ...infrastructure.repositories.yaml_config_repository import (
+                YamlConfigRepository,
+            )
+
             config_repo = YamlConfigRepository(str(config_path))
             await config_repo.load_configuration()
             services = await config_repo.load_services()
@@ -194,6 +198,10 @@ async def validate_ssh_config_command(
             raise typer.Exit(1)
 
         # Load configuration
+        from ...infrastructure.repositories.yaml_config_repository import (
+            YamlConfigRepository,
+        )
+
         config_repo = YamlConfigRepository(str(config_path))
         await config_repo.load_configuration()
         services = await config_repo.load_services()
@@ -221,6 +229,8 @@ async def validate_ssh_config_command(
                 raise typer.Exit(1)
 
         # Validate each SSH service
+        from ...infrastructure.adapters.ssh_adapter import SSHAdapter
+
         ssh_adapter = SSHAdapter()
         validation_results = []
         
@@ -315,7 +325,7 @@ def test_ssh_connectivity_sync(
     config_file: str | None = typer.Option(None, "--config", "-c", help="Configuration file path")
 ) -> None:
     """Test SSH connectivity for a service or connection details."""
-    asyncio.run(test_ssh_connectivity_command(service_name, host, user, port, key_file, config_file))
+    run_async(test_ssh_connectivity_command(service_name, host, user, port, key_file, config_file))
 
 
 def validate_ssh_config_sync(
@@ -323,4 +333,4 @@ def validate_ssh_config_sync(
     service_name: str | None = typer.Option(None, "--service", "-s", help="Specific service to validate")
 ) -> None:
     """Validate SSH configuration in a config file."""
-    asyncio.run(validate_ssh_config_command(config_file, service_name))
+    run_async(validate_ssh_config_command(config_file, service_name))
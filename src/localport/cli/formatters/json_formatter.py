@@ -1,5 +1,6 @@
 """JSON formatters for CLI output."""
 
+import dataclasses
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -8,7 +9,12 @@ from uuid import UUID
 
 import structlog
 
-logger = structlog.get_logger()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = structlog.get_logger(__name__)
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -27,6 +33,9 @@ class JSONEncoder(json.JSONEncoder):
             return obj.isoformat()
         elif isinstance(obj, UUID):
             return str(obj)
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            # Slotted dataclasses have no __dict__; serialize by fields
+            return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
         elif hasattr(obj, '__dict__'):
             # Handle dataclasses and other objects with __dict__
             return obj.__dict__
@@ -55,6 +64,14 @@ class BaseJSONFormatter(ABC):
         """
         try:
             json_data = self._prepare_data(data, **kwargs)
+            if orjson is not None:
+                # orjson serializes at C speed and handles datetime/UUID
+                # natively; the encoder covers the remaining types.
+                return orjson.dumps(
+                    json_data,
+                    default=self.encoder.default,
+                    option=orjson.OPT_INDENT_2,
+                ).decode()
             return json.dumps(json_data, cls=JSONEncoder, indent=2, ensure_ascii=False)
         except Exception as e:
             logger.error("Failed to format JSON output", error=str(e))
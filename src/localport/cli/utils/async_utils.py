@@ -0,0 +1,38 @@
+"""Async execution helpers for the CLI."""
+
+import asyncio
+import atexit
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
+
+_runner: asyncio.Runner | None = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a process-wide event loop.
+
+    asyncio.run builds and tears down a fresh event loop (plus selector
+    and default executor) on every call; sharing one asyncio.Runner for
+    the life of the process amortizes that setup across the sync command
+    wrappers. When the optional uvloop dependency is installed, its
+    libuv-backed loop is used instead of the default selector loop.
+
+    Args:
+        coro: Coroutine to run to completion
+
+    Returns:
+        The coroutine's result
+    """
+    global _runner
+    if _runner is None:
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        _runner = asyncio.Runner(loop_factory=loop_factory)
+        atexit.register(_runner.close)
+    return _runner.run(coro)
@@ -1,18 +1,59 @@
 """Rich utilities for CLI formatting and logging."""
 
+import functools
 import logging
+import sys
+from typing import Final
 
 import structlog
-from rich.console import Console
+from rich.console import Console, RenderableType
 from rich.logging import RichHandler
+from rich.panel import Panel
+from rich.text import Text
 from rich.traceback import install
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _StderrWriteLogger:
+    """Minimal structlog logger that writes straight to sys.stderr.
+
+    sys.stderr is resolved per call rather than captured at configure
+    time, so output keeps working when the stream is replaced afterwards
+    (pytest capture, daemon redirection).
+    """
+
+    def msg(self, message: str) -> None:
+        sys.stderr.write(message + "\n")
+
+    log = debug = info = warning = error = critical = exception = fatal = msg
+
+
+_STDERR_LOGGER = _StderrWriteLogger()
+
+# Verbosity level -> stdlib log level, resolved once at import
+_LEVEL_MAP: Final[dict[int, int]] = {
+    -1: logging.ERROR,    # Quiet: Only errors
+    0: logging.WARNING,   # Clean: Only warnings/errors
+    1: logging.INFO,      # Informational: Include info logs
+    2: logging.DEBUG,     # Debug: Everything
+}
+
+
+def _stderr_logger_factory(*args) -> _StderrWriteLogger:
+    """Return the shared direct-write logger."""
+    return _STDERR_LOGGER
+
 
 def setup_rich_logging(
     verbosity_level: int = 0,
     console: Console | None = None,
     level: str | None = None,  # Backward compatibility
-    verbose: bool | None = None  # Backward compatibility
+    verbose: bool | None = None,  # Backward compatibility
+    use_stdlib: bool = False
 ) -> None:
     """Setup Rich-based logging with verbosity levels.
 
@@ -21,6 +62,7 @@ def setup_rich_logging(
         console: Rich console instance to use
         level: Legacy log level (for backward compatibility)
         verbose: Legacy verbose flag (for backward compatibility)
+        use_stdlib: Force the stdlib logging bridge even in clean mode
     """
     if console is None:
         console = Console()
@@ -33,16 +75,52 @@ def setup_rich_logging(
         else:
             verbosity_level = 0
 
-    # Map verbosity to log levels
-    log_level_map = {
-        -1: logging.ERROR,    # Quiet: Only errors
-        0: logging.WARNING,   # Clean: Only warnings/errors
-        1: logging.INFO,      # Informational: Include info logs
-        2: logging.DEBUG      # Debug: Everything
-    }
-    
-    log_level = log_level_map.get(verbosity_level, logging.WARNING)
-    
+    log_level = _LEVEL_MAP.get(verbosity_level, logging.WARNING)
+
+    if (verbosity_level <= 0 or not console.is_terminal) and not use_stdlib:
+        # Fast path for clean/quiet mode and for piped/redirected output
+        # (daemon mode, journald, files): emission is a direct stderr
+        # write instead of the RichHandler bridge — no markup parsing or
+        # ANSI computation per record — and the filtering bound logger
+        # turns below-level calls into no-ops before any processor (or
+        # kwargs merge) runs.
+        if verbosity_level >= 2 and orjson is not None:
+            final_processor = structlog.processors.JSONRenderer(
+                serializer=lambda obj, **kw: orjson.dumps(obj).decode()
+            )
+        elif verbosity_level >= 2:
+            final_processor = structlog.processors.JSONRenderer()
+        else:
+            final_processor = structlog.processors.KeyValueRenderer(
+                key_order=['event'],
+                drop_missing=True
+            )
+
+        # No StackInfoRenderer here: nothing in the codebase passes
+        # stack_info, and every dropped processor is a function call per
+        # record. format_exc_info stays so logger.exception() still
+        # renders tracebacks.
+        processors = [
+            structlog.processors.add_log_level,
+            structlog.processors.format_exc_info,
+            final_processor,
+        ]
+        if verbosity_level >= 1:
+            # Verbose logs headed for a file still want timestamps
+            processors.insert(0, structlog.processors.TimeStamper(fmt="iso"))
+
+        structlog.configure(
+            processors=processors,
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            logger_factory=_stderr_logger_factory,
+            cache_logger_on_first_use=True,
+        )
+
+        # Keep stdlib logging configured at the same level for
+        # third-party libraries; no Rich handler in this mode.
+        logging.basicConfig(level=log_level, format="%(message)s", force=True)
+        return
+
     # Install rich traceback handler
     install(console=console, show_locals=(verbosity_level >= 2))
 
@@ -92,8 +170,15 @@ def setup_rich_logging(
 
     # Configure structlog based on verbosity level
     if verbosity_level >= 2:
-        # Debug mode: Use JSON renderer for structured output
-        final_processor = structlog.processors.JSONRenderer()
+        # Debug mode: Use JSON renderer for structured output. orjson
+        # serializes at C speed when available; the stdlib bridge needs
+        # str records, so its bytes output is decoded.
+        if orjson is not None:
+            final_processor = structlog.processors.JSONRenderer(
+                serializer=lambda obj, **kw: orjson.dumps(obj).decode()
+            )
+        else:
+            final_processor = structlog.processors.JSONRenderer()
     elif verbosity_level == 1:
         # Info mode: Use clean key-value renderer
         final_processor = structlog.processors.KeyValueRenderer(
@@ -109,7 +194,6 @@ def setup_rich_logging(
 
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
@@ -121,11 +205,60 @@ def setup_rich_logging(
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Filter in the wrapper instead of a filter_by_level processor:
+        # below-level calls short-circuit before any processor runs or
+        # event dict is merged, so suppressed logs cost a no-op call.
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
 
 
+class BufferedConsole(Console):
+    """Console that batches renderables into a single print call.
+
+    Rich parses markup and computes styles on every print; renderers
+    that emit several panels or tables per refresh can queue them with
+    write() and flush once with writeln().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_buffer: list[RenderableType] = []
+
+    def write(self, renderable: RenderableType) -> None:
+        """Queue a renderable without rendering it yet."""
+        self._line_buffer.append(renderable)
+
+    def writeln(self) -> None:
+        """Render and flush all queued renderables in one print."""
+        if self._line_buffer:
+            self.print(*self._line_buffer)
+            self._line_buffer.clear()
+
+
+# The row formatters below are pure functions of values that repeat
+# heavily (status names, ports, technologies), so they are memoized:
+# a status table with dozens of rows re-renders every watch tick, and
+# the cached markup strings cost a dict lookup instead of a call frame
+# plus a string build per cell.
+
+_STATUS_COLORS: Final[dict[str, str]] = {
+    "running": "green",
+    "stopped": "red",
+    "starting": "yellow",
+    "failed": "bright_red",
+    "restarting": "orange3",
+    "unknown": "dim",
+}
+
+_TECH_COLORS: Final[dict[str, str]] = {
+    "kubectl": "blue",
+    "ssh": "green",
+    "docker": "cyan",
+}
+
+
+@functools.lru_cache(maxsize=64)
 def get_status_color(status: str) -> str:
     """Get Rich color for service status.
 
@@ -135,17 +268,15 @@ def get_status_color(status: str) -> str:
     Returns:
         Rich color name
     """
-    status_colors = {
-        "running": "green",
-        "stopped": "red",
-        "starting": "yellow",
-        "failed": "bright_red",
-        "restarting": "orange3",
-        "unknown": "dim"
-    }
-    return status_colors.get(status.lower(), "white")
+    return _STATUS_COLORS.get(status.lower(), "white")
+
 
+# Uptime scales, largest first; the loop below does a single division
+# for whichever scale matches.
+_UPTIME_SCALES = ((86400, "d"), (3600, "h"), (60, "m"))
 
+
+@functools.lru_cache(maxsize=1024)
 def format_uptime(seconds: float) -> str:
     """Format uptime in a human-readable format.
 
@@ -155,19 +286,19 @@ def format_uptime(seconds: float) -> str:
     Returns:
         Formatted uptime string
     """
-    if seconds < 60:
-        return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.1f}m"
-    elif seconds < 86400:
-        hours = seconds / 3600
-        return f"{hours:.1f}h"
-    else:
-        days = seconds / 86400
-        return f"{days:.1f}d"
+    for threshold, suffix in _UPTIME_SCALES:
+        if seconds >= threshold:
+            return f"{seconds / threshold:.1f}{suffix}"
+    return f"{seconds:.1f}s"
+
 
+# Precomputed markup templates; cache misses pay one %-interpolation
+# instead of parsing an f-string with embedded markup.
+_PORT_TMPL: Final[str] = "[cyan]%d[/cyan]"
+_SERVICE_NAME_TMPL: Final[str] = "[bold blue]%s[/bold blue]"
 
+
+@functools.lru_cache(maxsize=1024)
 def format_port(port: int) -> str:
     """Format port number with appropriate styling.
 
@@ -177,9 +308,10 @@ def format_port(port: int) -> str:
     Returns:
         Formatted port string
     """
-    return f"[cyan]{port}[/cyan]"
+    return _PORT_TMPL % port
 
 
+@functools.lru_cache(maxsize=256)
 def format_service_name(name: str) -> str:
     """Format service name with appropriate styling.
 
@@ -189,9 +321,10 @@ def format_service_name(name: str) -> str:
     Returns:
         Formatted service name
     """
-    return f"[bold blue]{name}[/bold blue]"
+    return _SERVICE_NAME_TMPL % name
 
 
+@functools.lru_cache(maxsize=64)
 def format_technology(technology) -> str:
     """Format technology name with appropriate styling.
 
@@ -209,15 +342,17 @@ def format_technology(technology) -> str:
         # It's already a string
         tech_str = str(technology)
     
-    tech_colors = {
-        "kubectl": "blue",
-        "ssh": "green",
-        "docker": "cyan"
-    }
-    color = tech_colors.get(tech_str.lower(), "white")
+    color = _TECH_COLORS.get(tech_str.lower(), "white")
     return f"[{color}]{tech_str}[/{color}]"
 
 
+# The two fixed health markup strings are interned module constants;
+# only the failure-count variant needs building per distinct count.
+_HEALTHY_MARKUP = sys.intern("[green]✓ Healthy[/green]")
+_UNHEALTHY_MARKUP = sys.intern("[red]✗ Unhealthy[/red]")
+
+
+@functools.lru_cache(maxsize=128)
 def format_health_status(is_healthy: bool, failure_count: int = 0) -> str:
     """Format health status with appropriate styling.
 
@@ -229,15 +364,13 @@ def format_health_status(is_healthy: bool, failure_count: int = 0) -> str:
         Formatted health status string
     """
     if is_healthy:
-        return "[green]✓ Healthy[/green]"
-    else:
-        if failure_count > 0:
-            return f"[red]✗ Unhealthy ({failure_count} failures)[/red]"
-        else:
-            return "[red]✗ Unhealthy[/red]"
+        return _HEALTHY_MARKUP
+    if failure_count > 0:
+        return f"[red]✗ Unhealthy ({failure_count} failures)[/red]"
+    return _UNHEALTHY_MARKUP
 
 
-def create_error_panel(title: str, message: str, suggestion: str | None = None) -> str:
+def create_error_panel(title: str, message: str, suggestion: str | None = None) -> Panel:
     """Create a formatted error panel.
 
     Args:
@@ -246,11 +379,8 @@ def create_error_panel(title: str, message: str, suggestion: str | None = None)
         suggestion: Optional suggestion for fixing the error
 
     Returns:
-        Formatted error panel markup
+        Renderable error panel
     """
-    from rich.panel import Panel
-    from rich.text import Text
-
     content = Text()
     content.append(message, style="red")
 
@@ -269,7 +399,7 @@ def create_error_panel(title: str, message: str, suggestion: str | None = None)
     return panel
 
 
-def create_success_panel(title: str, message: str) -> str:
+def create_success_panel(title: str, message: str) -> Panel:
     """Create a formatted success panel.
 
     Args:
@@ -277,11 +407,8 @@ def create_success_panel(title: str, message: str) -> str:
         message: Success message
 
     Returns:
-        Formatted success panel markup
+        Renderable success panel
     """
-    from rich.panel import Panel
-    from rich.text import Text
-
     content = Text()
     content.append("✓ ", style="green")
     content.append(message, style="white")
@@ -296,7 +423,7 @@ def create_success_panel(title: str, message: str) -> str:
     return panel
 
 
-def create_info_panel(title: str, message: str) -> str:
+def create_info_panel(title: str, message: str) -> Panel:
     """Create a formatted info panel.
 
     Args:
@@ -304,11 +431,8 @@ def create_info_panel(title: str, message: str) -> str:
         message: Info message
 
     Returns:
-        Formatted info panel markup
+        Renderable info panel
     """
-    from rich.panel import Panel
-    from rich.text import Text
-
     content = Text()
     content.append("ℹ ", style="blue")
     content.append(message, style="white")
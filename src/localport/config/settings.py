@@ -7,7 +7,7 @@ import structlog
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class Settings(BaseSettings):
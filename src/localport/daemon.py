@@ -25,7 +25,7 @@ from .infrastructure.shutdown import (
     TaskManager,
 )
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class LocalPortDaemon:
@@ -1,5 +1,6 @@
 """Port forward entity representing an active port forwarding process."""
 
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
@@ -16,6 +17,10 @@ class PortForward:
     started_at: datetime
     last_health_check: datetime | None = None
     restart_count: int = 0
+    # Monotonic start reference for uptime math; wall-clock started_at is
+    # kept for display. None for forwards restored from persisted state,
+    # where the original monotonic reference is no longer meaningful.
+    monotonic_started_at: float | None = None
 
     def is_process_alive(self) -> bool:
         """Check if the underlying process is still alive."""
@@ -37,7 +42,14 @@ class PortForward:
         self.last_health_check = check_time or datetime.now()
 
     def get_uptime_seconds(self) -> float:
-        """Get the uptime of the port forward in seconds."""
+        """Get the uptime of the port forward in seconds.
+
+        Uses the monotonic clock when available so uptime is immune to
+        wall-clock adjustments; falls back to started_at for forwards
+        restored from persisted state.
+        """
+        if self.monotonic_started_at is not None:
+            return time.monotonic() - self.monotonic_started_at
         return (datetime.now() - self.started_at).total_seconds()
 
     def should_restart(self, max_restarts: int = 5) -> bool:
@@ -1,6 +1,6 @@
 """Service entity representing a port forwarding service."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID, uuid4, uuid5, NAMESPACE_DNS
 import traceback
@@ -10,10 +10,10 @@ import structlog
 from ..enums import ForwardingTechnology, ServiceStatus
 from ..value_objects.connection_info import ConnectionInfo
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Service:
     """Core service entity representing a port forwarding service."""
 
@@ -26,14 +26,13 @@ class Service:
     status: ServiceStatus = ServiceStatus.STOPPED
     health_check_config: dict[str, Any] | None = None
     restart_policy: dict[str, Any] | None = None
-    tags: list[str] = None
+    tags: set[str] = field(default_factory=set)
     description: str | None = None
 
     def __post_init__(self) -> None:
-        """Initialize default values after dataclass creation."""
-        if self.tags is None:
-            self.tags = []
-        
+        """Normalize tags to a set (configs and callers pass lists)."""
+        if not isinstance(self.tags, set):
+            self.tags = set(self.tags)
 
     @staticmethod
     def generate_deterministic_id(
@@ -130,10 +129,12 @@ class Service:
 
     def add_tag(self, tag: str) -> None:
         """Add a tag to the service."""
-        if tag not in self.tags:
-            self.tags.append(tag)
+        self.tags.add(tag)
 
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from the service."""
-        if tag in self.tags:
-            self.tags.remove(tag)
+        self.tags.discard(tag)
+
+    def tags_ordered(self) -> list[str]:
+        """Return tags as a sorted list for display and serialization."""
+        return sorted(self.tags)
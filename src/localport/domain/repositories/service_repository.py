@@ -21,6 +21,22 @@ class ServiceRepository(ABC):
         """
         pass
 
+    async def replace_all(self, services: list[Service]) -> None:
+        """Replace the full service set with a new snapshot.
+
+        The default implementation saves each service in turn; in-memory
+        implementations can override this with an atomic swap so readers
+        never observe a partially reloaded configuration.
+
+        Args:
+            services: The new complete list of services
+
+        Raises:
+            RepositoryError: If the services cannot be saved
+        """
+        for service in services:
+            await self.save(service)
+
     @abstractmethod
     async def find_by_id(self, service_id: UUID) -> Service | None:
         """Find a service by ID.
@@ -11,7 +11,7 @@ from ..entities.service import Service, ServiceStatus
 from ..value_objects.connection_info import ConnectionInfo
 from ..value_objects.port import Port
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class PortConflictResolver(ABC):
@@ -9,7 +9,7 @@ from .base_adapter import AdapterNotAvailableError, PortForwardingAdapter
 from .kubectl_adapter import KubectlAdapter
 from .ssh_adapter import SSHAdapter
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class AdapterType(str, Enum):
@@ -7,7 +7,7 @@ import structlog
 
 from ...domain.value_objects.connection_info import ConnectionInfo
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class PortForwardingAdapter(ABC):
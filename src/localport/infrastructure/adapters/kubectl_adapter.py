@@ -10,7 +10,7 @@ from .base_adapter import PortForwardingAdapter
 from ...domain.value_objects.connection_info import ConnectionInfo
 from ..logging.service_log_manager import get_service_log_manager
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class KubectlAdapter(PortForwardingAdapter):
@@ -99,20 +99,24 @@ class KubectlAdapter(PortForwardingAdapter):
                    log_file=str(log_file))
 
         try:
+            import functools
             import subprocess
-            import os
             
             # Open log file for writing
             log_file_handle = open(log_file, 'a', encoding='utf-8', buffering=1)  # Line buffered
             
-            # Use subprocess.Popen with log file output
-            process = subprocess.Popen(
+            # Spawn detached via subprocess.Popen (the forward must outlive
+            # this process), but run the blocking fork/exec in the executor
+            # so concurrent batch starts overlap instead of serializing.
+            loop = asyncio.get_running_loop()
+            process = await loop.run_in_executor(None, functools.partial(
+                subprocess.Popen,
                 cmd,
                 stdout=log_file_handle,
                 stderr=subprocess.STDOUT,  # Combine stderr with stdout
                 stdin=subprocess.DEVNULL,
                 start_new_session=True  # Create new session
-            )
+            ))
 
             logger.info("kubectl subprocess created with logging", 
                        pid=process.pid,
@@ -220,19 +224,23 @@ class KubectlAdapter(PortForwardingAdapter):
 
         try:
             # Start the process completely detached using subprocess.Popen
+            import functools
             import subprocess
-            import os
             
             logger.info("Starting kubectl subprocess", command=cmd)
             
-            # Use subprocess.Popen for better control over detachment
-            process = subprocess.Popen(
+            # Popen keeps the forward detached from this process; the
+            # blocking fork/exec runs in the executor so batch starts
+            # dispatched via asyncio.gather actually overlap.
+            loop = asyncio.get_running_loop()
+            process = await loop.run_in_executor(None, functools.partial(
+                subprocess.Popen,
                 cmd,
                 stdout=subprocess.DEVNULL,  # Don't capture output to avoid keeping references
                 stderr=subprocess.DEVNULL,
                 stdin=subprocess.DEVNULL,
                 start_new_session=True  # Create new session
-            )
+            ))
 
             logger.info("kubectl subprocess created", pid=process.pid)
 
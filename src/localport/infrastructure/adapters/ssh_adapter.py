@@ -11,7 +11,7 @@ from .base_adapter import PortForwardingAdapter
 from ..logging.service_log_manager import get_service_log_manager
 from ...domain.value_objects.connection_info import ConnectionInfo
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class SSHAdapter(PortForwardingAdapter):
@@ -8,7 +8,7 @@ from .base_health_checker import HealthChecker
 from .http_health_check import HTTPHealthCheck
 from .tcp_health_check import TCPHealthCheck
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class HealthCheckFactory:
@@ -19,12 +19,18 @@ class HealthCheckFactory:
             'tcp': TCPHealthCheck,
             'http': HTTPHealthCheck,
         }
+        self._instance_cache: dict[tuple[str, tuple], HealthChecker] = {}
 
         # Try to import optional health checkers
         self._register_optional_health_checkers()
 
     def create_health_checker(self, check_type: str, config: dict[str, Any]) -> HealthChecker:
-        """Create a health checker instance.
+        """Create (or reuse) a health checker instance.
+
+        Checkers are stateless between probes (configuration is passed to
+        check_health), so instances are memoized by (type, config): the
+        monitor loop requests the same checker on every tick and gets the
+        already-validated instance back instead of a fresh allocation.
 
         Args:
             check_type: Type of health check (tcp, http, kafka, postgres)
@@ -40,18 +46,31 @@ class HealthCheckFactory:
             available_types = list(self._health_checkers.keys())
             raise ValueError(f"Unsupported health check type '{check_type}'. Available types: {available_types}")
 
+        try:
+            cache_key = (check_type, tuple(sorted(config.items())) if config else ())
+        except TypeError:
+            # Config contains unhashable values (nested dicts); skip caching
+            cache_key = None
+
+        if cache_key is not None:
+            cached = self._instance_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         health_checker_class = self._health_checkers[check_type]
 
         try:
             # Create health checker instance (no config in constructor)
             health_checker = health_checker_class()
-            
+
             # Validate configuration if provided
             if config and not health_checker.validate_config(config):
                 raise ValueError(f"Invalid configuration for {check_type} health checker")
-            
+
+            if cache_key is not None:
+                self._instance_cache[cache_key] = health_checker
             return health_checker
-            
+
         except Exception as e:
             logger.error("Failed to create health checker",
                         check_type=check_type,
@@ -67,6 +86,9 @@ class HealthCheckFactory:
             health_checker_class: Health checker class
         """
         self._health_checkers[check_type] = health_checker_class
+        # Drop memoized instances of the replaced type
+        for key in [k for k in self._instance_cache if k[0] == check_type]:
+            del self._instance_cache[key]
         logger.info("Registered health checker", check_type=check_type)
 
     def get_supported_types(self) -> list[str]:
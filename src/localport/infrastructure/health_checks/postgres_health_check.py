@@ -1,6 +1,11 @@
 """PostgreSQL-specific health check implementation."""
 
 import asyncio
+import functools
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Dict
 
@@ -9,15 +14,179 @@ import structlog
 from ...domain.entities.health_check import HealthCheckResult
 from .base_health_checker import HealthChecker
 
-logger = structlog.get_logger()
+try:
+    import psycopg
+    from psycopg import DatabaseError, OperationalError
+    from psycopg.conninfo import make_conninfo
+    _HAS_PSYCOPG = True
+except ImportError:
+    psycopg = None
+    _HAS_PSYCOPG = False
+
+try:
+    # Pooled connections reuse the TCP+TLS+startup handshake across
+    # probes instead of paying it on every check
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:
+    AsyncConnectionPool = None
+
+logger = structlog.get_logger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Cheap level guard so success-path debug calls skip building
+    their kwargs when DEBUG is filtered out."""
+    return logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+
+# Upper bound on warm connections kept per distinct conninfo, so
+# repeated probes cannot pile connections onto the server
+_POOL_MAX_SIZE = 5
+
+# How long a confirmed database/table existence result stays valid.
+# Existing objects rarely vanish; negative answers are never cached so
+# a missing object is re-probed on every call.
+_POSITIVE_TTL = 60.0
+
+
+@functools.lru_cache(maxsize=32)
+def _conninfo_from_parts(
+    host: str,
+    port: int,
+    database: str,
+    user: str,
+    password: str,
+    sslmode: str | None
+) -> str:
+    """Assemble a conninfo string, memoized per distinct parameter set.
+
+    Probes against a stable config rebuild the identical string every
+    few seconds; caching removes that per-probe allocation churn.
+    """
+    if _HAS_PSYCOPG:
+        # make_conninfo handles quoting and None-skipping correctly,
+        # which the hand-rolled join did not (e.g. passwords with
+        # spaces)
+        return make_conninfo(
+            host=host,
+            port=port,
+            dbname=database,
+            user=user,
+            password=password or None,
+            sslmode=sslmode
+        )
+
+    conn_parts = [
+        f"host={host}",
+        f"port={port}",
+        f"dbname={database}",
+        f"user={user}"
+    ]
+
+    if password:
+        conn_parts.append(f"password={password}")
+
+    if sslmode:
+        conn_parts.append(f"sslmode={sslmode}")
+
+    return " ".join(conn_parts)
 
 
 class PostgreSQLHealthCheck(HealthChecker):
     """PostgreSQL-specific health check using database connectivity."""
 
+    # Pools keyed by (loop, conninfo). Like the shared aiohttp sessions,
+    # pools are bound to the running event loop, so the loop is part of
+    # the cache key.
+    _pools: dict[tuple, Any] = {}
+
     def __init__(self):
         """Initialize PostgreSQL health check."""
-        pass
+        # Positive existence results mapped to a monotonic expiry
+        self._positive_cache: dict[tuple, float] = {}
+
+    @classmethod
+    async def _get_pool(cls, conninfo: str, timeout: float) -> Any:
+        """Get (or lazily create and open) the pool for this conninfo."""
+        loop = asyncio.get_running_loop()
+        key = (id(loop), conninfo)
+        pool = cls._pools.get(key)
+        if pool is None or pool.closed:
+            pool = AsyncConnectionPool(
+                conninfo,
+                min_size=1,
+                max_size=_POOL_MAX_SIZE,
+                timeout=timeout,
+                # Health queries are independent read-only SELECTs;
+                # autocommit drops the implicit BEGIN/COMMIT messages
+                # around each one
+                kwargs={"connect_timeout": timeout, "autocommit": True},
+                # Validate idle connections on acquire so a shallow
+                # check can trust a successful acquire as liveness
+                check=AsyncConnectionPool.check_connection,
+                open=False,
+            )
+            await pool.open()
+            cls._pools[key] = pool
+        return pool
+
+    @asynccontextmanager
+    async def _connection(
+        self,
+        config: dict[str, Any],
+        database: str | None = None
+    ) -> AsyncIterator[Any]:
+        """Acquire a connection for this config, pooled when available.
+
+        Falls back to a direct connect when psycopg_pool is not
+        installed, so the optional dependency stays optional.
+
+        Args:
+            config: Configuration containing connection parameters
+            database: Overrides the config's database when set
+        """
+        conninfo = self._build_connection_string(config, database=database)
+        timeout = config.get('timeout', 10.0)
+
+        if AsyncConnectionPool is not None:
+            pool = await self._get_pool(conninfo, timeout)
+            async with pool.connection(timeout=timeout) as conn:
+                yield conn
+        else:
+            # asyncio.wait_for enforces the budget with sub-second
+            # precision; libpq's own connect_timeout is whole seconds
+            # with a two-second floor, too coarse for fast-fail probes
+            conn = await asyncio.wait_for(
+                psycopg.AsyncConnection.connect(
+                    conninfo,
+                    connect_timeout=timeout,
+                    autocommit=True
+                ),
+                timeout
+            )
+            async with conn:
+                yield conn
+
+    @staticmethod
+    async def _tcp_probe(host: str, port: int, timeout: float) -> bool:
+        """Check listener reachability with a bare TCP connect."""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout
+            )
+        except (TimeoutError, OSError):
+            return False
+        writer.close()
+        await writer.wait_closed()
+        return True
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close all shared pools (shutdown hook)."""
+        pools = list(cls._pools.values())
+        cls._pools.clear()
+        for pool in pools:
+            if not pool.closed:
+                await pool.close()
 
     async def check_health(self, config: Dict[str, Any]) -> HealthCheckResult:
         """Perform PostgreSQL health check with given configuration.
@@ -34,26 +203,15 @@ class PostgreSQLHealthCheck(HealthChecker):
         start_time = datetime.now()
         
         try:
-            # Import psycopg here to make it optional
-            try:
-                import psycopg
-                from psycopg import DatabaseError, OperationalError
-            except ImportError:
+            if not _HAS_PSYCOPG:
                 return HealthCheckResult.error("psycopg not installed. Install with: pip install psycopg[binary]")
 
-            # Build connection string
-            connection_string = self._build_connection_string(merged_config)
-            timeout = merged_config.get('timeout', 10.0)
-
             # Test connection
             try:
-                async with psycopg.AsyncConnection.connect(
-                    connection_string,
-                    connect_timeout=timeout
-                ) as conn:
+                async with self._connection(merged_config) as conn:
                     # Execute a simple query to verify the connection works
                     async with conn.cursor() as cur:
-                        await cur.execute("SELECT 1")
+                        await cur.execute("SELECT 1", prepare=True)
                         result = await cur.fetchone()
 
                         # Calculate response time
@@ -61,9 +219,10 @@ class PostgreSQLHealthCheck(HealthChecker):
                         response_time_ms = (end_time - start_time).total_seconds() * 1000
 
                         if result and result[0] == 1:
-                            logger.debug("PostgreSQL health check passed",
-                                        host=merged_config.get('host', 'localhost'),
-                                        database=merged_config.get('database', 'postgres'))
+                            if _debug_enabled():
+                                logger.debug("PostgreSQL health check passed",
+                                            host=merged_config.get('host', 'localhost'),
+                                            database=merged_config.get('database', 'postgres'))
                             return HealthCheckResult.healthy(
                                 message=f"PostgreSQL connection to {merged_config.get('host', 'localhost')}:{merged_config.get('port', 5432)} successful",
                                 response_time_ms=response_time_ms
@@ -94,39 +253,101 @@ class PostgreSQLHealthCheck(HealthChecker):
     async def check(self, config: dict[str, Any]) -> bool:
         """Check PostgreSQL connectivity via database connection.
 
+        Shallow by default: acquiring a pool-validated connection is
+        the liveness signal and costs no query. Pass mode: "deep" for
+        the full SELECT round-trip (check_deep).
+
         Args:
             config: Configuration containing database connection parameters
 
         Returns:
             True if PostgreSQL is healthy, False otherwise
         """
+        if config.get('fast', False):
+            # Raw TCP connect: no TLS, SCRAM or startup packet, and no
+            # psycopg needed — enough for "is something listening on
+            # host:port" semantics
+            return await self._tcp_probe(
+                config.get('host', 'localhost'),
+                config.get('port', 5432),
+                config.get('timeout', 10.0)
+            )
+
+        if config.get('mode', 'shallow') == 'deep':
+            return await self.check_deep(config)
+
         try:
-            # Import psycopg here to make it optional
-            try:
-                import psycopg
-                from psycopg import DatabaseError, OperationalError
-            except ImportError:
+            if not _HAS_PSYCOPG:
                 logger.error("psycopg not installed. Install with: pip install psycopg[binary]")
                 return False
 
-            # Build connection string
-            connection_string = self._build_connection_string(config)
+            async with self._connection(config):
+                return True
+
+        except Exception as e:
+            logger.debug("PostgreSQL health check failed",
+                        host=config.get('host', 'localhost'),
+                        database=config.get('database', 'postgres'),
+                        error=str(e))
+            return False
+
+    async def check_many(
+        self,
+        configs: list[dict[str, Any]],
+        max_parallel: int = 10
+    ) -> list[bool]:
+        """Check several configurations concurrently.
+
+        Total latency becomes the slowest probe instead of the sum of
+        all of them; the semaphore keeps a large batch from opening
+        every connection at once.
+
+        Args:
+            configs: Configurations to probe
+            max_parallel: Maximum probes in flight at once
+
+        Returns:
+            One boolean per config, in input order
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def probe(config: dict[str, Any]) -> bool:
+            async with semaphore:
+                return await self.check(config)
+
+        outcomes = await asyncio.gather(
+            *(probe(config) for config in configs),
+            return_exceptions=True
+        )
+        return [outcome is True for outcome in outcomes]
+
+    async def check_deep(self, config: dict[str, Any]) -> bool:
+        """Check PostgreSQL health with an end-to-end query round-trip.
+
+        Args:
+            config: Configuration containing database connection parameters
+
+        Returns:
+            True if PostgreSQL is healthy, False otherwise
+        """
+        try:
+            if not _HAS_PSYCOPG:
+                logger.error("psycopg not installed. Install with: pip install psycopg[binary]")
+                return False
 
             # Test connection
             try:
-                async with psycopg.AsyncConnection.connect(
-                    connection_string,
-                    connect_timeout=self.timeout
-                ) as conn:
+                async with self._connection(config) as conn:
                     # Execute a simple query to verify the connection works
                     async with conn.cursor() as cur:
-                        await cur.execute("SELECT 1")
+                        await cur.execute("SELECT 1", prepare=True)
                         result = await cur.fetchone()
 
                         if result and result[0] == 1:
-                            logger.debug("PostgreSQL health check passed",
-                                        host=config.get('host', 'localhost'),
-                                        database=config.get('database', 'postgres'))
+                            if _debug_enabled():
+                                logger.debug("PostgreSQL health check passed",
+                                            host=config.get('host', 'localhost'),
+                                            database=config.get('database', 'postgres'))
                             return True
                         else:
                             logger.debug("PostgreSQL health check failed - unexpected query result")
@@ -146,43 +367,81 @@ class PostgreSQLHealthCheck(HealthChecker):
                         error=str(e))
             return False
 
-    def _build_connection_string(self, config: dict[str, Any]) -> str:
-        """Build PostgreSQL connection string from configuration.
+    async def check_detailed(self, config: dict[str, Any]) -> dict[str, Any]:
+        """Check liveness, server version and CONNECT privilege in one trip.
+
+        check(), get_server_version() and check_user_permissions() each
+        pay a connection acquire plus a query round-trip; callers that
+        want more than a boolean get all three answers from a single
+        SELECT here. The individual methods remain for callers that
+        only need one.
 
         Args:
-            config: Configuration dictionary
+            config: Configuration containing database connection parameters
 
         Returns:
-            PostgreSQL connection string
+            Dict with 'ok', 'version' and 'can_connect' keys; 'ok' is
+            False and the others None when the probe fails
         """
-        # Extract connection parameters with defaults
-        host = config.get('host', 'localhost')
-        port = config.get('port', 5432)
-        database = config.get('database', 'postgres')
+        result: dict[str, Any] = {'ok': False, 'version': None, 'can_connect': None}
+
+        if not _HAS_PSYCOPG:
+            return result
+
         user = config.get('user', 'postgres')
-        password = config.get('password', '')
-        timeout = config.get('timeout', 10.0)
+        database = config.get('database', 'postgres')
 
-        # Build connection string
-        conn_parts = [
-            f"host={host}",
-            f"port={port}",
-            f"dbname={database}",
-            f"user={user}"
-        ]
+        try:
+            async with self._connection(config) as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        """
+                        SELECT 1 AS ok,
+                               version() AS ver,
+                               has_database_privilege(%s, %s, 'CONNECT') AS can_connect
+                        """,
+                        (user, database),
+                        prepare=True
+                    )
+                    row = await cur.fetchone()
 
-        if password:
-            conn_parts.append(f"password={password}")
+            if row:
+                result['ok'] = row[0] == 1
+                result['version'] = row[1]
+                result['can_connect'] = bool(row[2])
 
-        # Add SSL configuration if specified
-        sslmode = config.get('sslmode')
-        if sslmode:
-            conn_parts.append(f"sslmode={sslmode}")
+            if _debug_enabled():
+                logger.debug("PostgreSQL detailed check completed",
+                            host=config.get('host', 'localhost'),
+                            database=database,
+                            ok=result['ok'])
+            return result
 
-        # Add connection timeout
-        conn_parts.append(f"connect_timeout={int(timeout)}")
+        except Exception as e:
+            logger.debug("PostgreSQL detailed check failed",
+                        host=config.get('host', 'localhost'),
+                        database=database,
+                        error=str(e))
+            return result
 
-        return " ".join(conn_parts)
+    def _build_connection_string(self, config: dict[str, Any], database: str | None = None) -> str:
+        """Build PostgreSQL connection string from configuration.
+
+        Args:
+            config: Configuration dictionary
+            database: Overrides the config's database when set
+
+        Returns:
+            PostgreSQL connection string
+        """
+        return _conninfo_from_parts(
+            config.get('host', 'localhost'),
+            config.get('port', 5432),
+            database if database is not None else config.get('database', 'postgres'),
+            config.get('user', 'postgres'),
+            config.get('password', ''),
+            config.get('sslmode')
+        )
 
     async def check_database_exists(self, config: dict[str, Any], database_name: str) -> bool:
         """Check if a specific database exists.
@@ -194,30 +453,40 @@ class PostgreSQLHealthCheck(HealthChecker):
         Returns:
             True if database exists, False otherwise
         """
-        try:
-            import psycopg
-
-            # Connect to the default postgres database to check for existence
-            check_config = config.copy()
-            check_config['database'] = 'postgres'  # Connect to default database
+        cache_key = (
+            'db',
+            config.get('host', 'localhost'),
+            config.get('port', 5432),
+            database_name
+        )
+        if time.monotonic() < self._positive_cache.get(cache_key, 0.0):
+            return True
 
-            connection_string = self._build_connection_string(check_config)
+        try:
+            if not _HAS_PSYCOPG:
+                return False
 
-            async with psycopg.AsyncConnection.connect(
-                connection_string,
-                connect_timeout=self.timeout
-            ) as conn:
+            # Connect to the default postgres database to check for
+            # existence; the override avoids copying the config dict
+            # on every probe
+            async with self._connection(config, database='postgres') as conn:
                 async with conn.cursor() as cur:
+                    # pg_catalog qualification skips search_path
+                    # resolution and LIMIT 1 stops at the first match
                     await cur.execute(
-                        "SELECT 1 FROM pg_database WHERE datname = %s",
-                        (database_name,)
+                        "SELECT 1 FROM pg_catalog.pg_database WHERE datname = %s LIMIT 1",
+                        (database_name,),
+                        prepare=True
                     )
                     result = await cur.fetchone()
 
                     exists = result is not None
-                    logger.debug("PostgreSQL database existence check",
-                                database=database_name,
-                                exists=exists)
+                    if exists:
+                        self._positive_cache[cache_key] = time.monotonic() + _POSITIVE_TTL
+                    if _debug_enabled():
+                        logger.debug("PostgreSQL database existence check",
+                                    database=database_name,
+                                    exists=exists)
                     return exists
 
         except Exception as e:
@@ -237,29 +506,41 @@ class PostgreSQLHealthCheck(HealthChecker):
         Returns:
             True if table exists, False otherwise
         """
-        try:
-            import psycopg
+        cache_key = (
+            'table',
+            config.get('host', 'localhost'),
+            config.get('port', 5432),
+            config.get('database', 'postgres'),
+            schema,
+            table_name
+        )
+        if time.monotonic() < self._positive_cache.get(cache_key, 0.0):
+            return True
 
-            connection_string = self._build_connection_string(config)
+        try:
+            if not _HAS_PSYCOPG:
+                return False
 
-            async with psycopg.AsyncConnection.connect(
-                connection_string,
-                connect_timeout=self.timeout
-            ) as conn:
+            async with self._connection(config) as conn:
                 async with conn.cursor() as cur:
+                    # to_regclass is a direct catalog lookup; the
+                    # information_schema.tables view joins several
+                    # catalogs and gets slow on databases with many
+                    # tables
                     await cur.execute(
-                        """
-                        SELECT 1 FROM information_schema.tables
-                        WHERE table_schema = %s AND table_name = %s
-                        """,
-                        (schema, table_name)
+                        "SELECT to_regclass(%s)",
+                        (f"{schema}.{table_name}",),
+                        prepare=True
                     )
                     result = await cur.fetchone()
 
-                    exists = result is not None
-                    logger.debug("PostgreSQL table existence check",
-                                table=f"{schema}.{table_name}",
-                                exists=exists)
+                    exists = result is not None and result[0] is not None
+                    if exists:
+                        self._positive_cache[cache_key] = time.monotonic() + _POSITIVE_TTL
+                    if _debug_enabled():
+                        logger.debug("PostgreSQL table existence check",
+                                    table=f"{schema}.{table_name}",
+                                    exists=exists)
                     return exists
 
         except Exception as e:
@@ -282,59 +563,49 @@ class PostgreSQLHealthCheck(HealthChecker):
             required_permissions = ['CONNECT']
 
         try:
-            import psycopg
+            if not _HAS_PSYCOPG:
+                return False
 
-            connection_string = self._build_connection_string(config)
             user = config.get('user', 'postgres')
             database = config.get('database', 'postgres')
 
-            async with psycopg.AsyncConnection.connect(
-                connection_string,
-                connect_timeout=self.timeout
-            ) as conn:
+            # Data-level permissions all reduce to the same schema USAGE
+            # probe, so one statement answers every requested privilege
+            # instead of a round-trip per permission
+            needs_usage = any(
+                permission.upper() in ('SELECT', 'INSERT', 'UPDATE', 'DELETE')
+                for permission in required_permissions
+            )
+
+            async with self._connection(config) as conn:
                 async with conn.cursor() as cur:
-                    # Check database-level permissions
                     await cur.execute(
                         """
-                        SELECT has_database_privilege(%s, %s, %s) as has_permission
+                        SELECT has_database_privilege(%s, %s, 'CONNECT') as has_connect,
+                               has_schema_privilege(%s, 'public', 'USAGE') as has_usage
                         """,
-                        (user, database, 'CONNECT')
+                        (user, database, user),
+                        prepare=True
                     )
                     result = await cur.fetchone()
 
-                    has_connect = result and result[0]
-
-                    if not has_connect:
-                        logger.debug("PostgreSQL user lacks CONNECT permission",
-                                    user=user,
-                                    database=database)
-                        return False
-
-                    # Check for additional permissions if specified
-                    for permission in required_permissions:
-                        if permission.upper() == 'CONNECT':
-                            continue  # Already checked
-
-                        # Check table-level permissions (simplified check)
-                        if permission.upper() in ['SELECT', 'INSERT', 'UPDATE', 'DELETE']:
-                            await cur.execute(
-                                """
-                                SELECT has_schema_privilege(%s, 'public', 'USAGE') as has_usage
-                                """,
-                                (user,)
-                            )
-                            result = await cur.fetchone()
+            if not (result and result[0]):
+                logger.debug("PostgreSQL user lacks CONNECT permission",
+                            user=user,
+                            database=database)
+                return False
 
-                            if not (result and result[0]):
-                                logger.debug("PostgreSQL user lacks schema permissions",
-                                            user=user,
-                                            permission=permission)
-                                return False
+            if needs_usage and not result[1]:
+                logger.debug("PostgreSQL user lacks schema permissions",
+                            user=user,
+                            permissions=required_permissions)
+                return False
 
-                    logger.debug("PostgreSQL user permissions check passed",
-                                user=user,
-                                permissions=required_permissions)
-                    return True
+            if _debug_enabled():
+                logger.debug("PostgreSQL user permissions check passed",
+                            user=user,
+                            permissions=required_permissions)
+            return True
 
         except Exception as e:
             logger.debug("PostgreSQL user permissions check failed",
@@ -352,22 +623,19 @@ class PostgreSQLHealthCheck(HealthChecker):
             Server version string if successful, None otherwise
         """
         try:
-            import psycopg
+            if not _HAS_PSYCOPG:
+                return None
 
-            connection_string = self._build_connection_string(config)
-
-            async with psycopg.AsyncConnection.connect(
-                connection_string,
-                connect_timeout=self.timeout
-            ) as conn:
+            async with self._connection(config) as conn:
                 async with conn.cursor() as cur:
-                    await cur.execute("SELECT version()")
+                    await cur.execute("SELECT version()", prepare=True)
                     result = await cur.fetchone()
 
                     if result:
                         version = result[0]
-                        logger.debug("PostgreSQL server version retrieved",
-                                    version=version)
+                        if _debug_enabled():
+                            logger.debug("PostgreSQL server version retrieved",
+                                        version=version)
                         return version
 
                     return None
@@ -388,32 +656,44 @@ class PostgreSQLHealthCheck(HealthChecker):
             True if all connections successful, False otherwise
         """
         try:
-            import psycopg
+            if not _HAS_PSYCOPG:
+                return False
 
-            connection_string = self._build_connection_string(config)
+            # Probe through the shared pool: the question is "can the
+            # pool service N concurrent acquires", not "can the server
+            # absorb N cold handshakes at once"
+            pool = None
+            if AsyncConnectionPool is not None and pool_size > _POOL_MAX_SIZE:
+                pool = await self._get_pool(
+                    self._build_connection_string(config),
+                    config.get('timeout', 10.0)
+                )
+                await pool.resize(min_size=1, max_size=pool_size)
 
-            # Create multiple connections concurrently
             async def test_connection():
-                async with psycopg.AsyncConnection.connect(
-                    connection_string,
-                    connect_timeout=self.timeout
-                ) as conn:
+                async with self._connection(config) as conn:
                     async with conn.cursor() as cur:
-                        await cur.execute("SELECT 1")
+                        await cur.execute("SELECT 1", prepare=True)
                         result = await cur.fetchone()
-                        return result and result[0] == 1
+                        return bool(result and result[0] == 1)
 
-            # Test multiple connections
-            tasks = [test_connection() for _ in range(pool_size)]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Test multiple concurrent acquires, each with an
+            # end-to-end SELECT round-trip
+            try:
+                tasks = [test_connection() for _ in range(pool_size)]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                if pool is not None:
+                    await pool.resize(min_size=1, max_size=_POOL_MAX_SIZE)
 
             # Check if all connections succeeded
             successful_connections = sum(1 for result in results if result is True)
 
-            logger.debug("PostgreSQL connection pool test",
-                        pool_size=pool_size,
-                        successful=successful_connections,
-                        all_successful=successful_connections == pool_size)
+            if _debug_enabled():
+                logger.debug("PostgreSQL connection pool test",
+                            pool_size=pool_size,
+                            successful=successful_connections,
+                            all_successful=successful_connections == pool_size)
 
             return successful_connections == pool_size
 
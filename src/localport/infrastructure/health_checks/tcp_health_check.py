@@ -1,6 +1,7 @@
 """TCP health check implementation."""
 
 import asyncio
+import logging
 import socket
 from datetime import datetime
 from typing import Any, Dict
@@ -10,7 +11,13 @@ import structlog
 from ...domain.entities.health_check import HealthCheckResult
 from .base_health_checker import HealthChecker
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Cheap level guard so success-path debug calls skip building
+    their kwargs when DEBUG is filtered out."""
+    return logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
 
 
 class TCPHealthCheck(HealthChecker):
@@ -71,15 +78,14 @@ class TCPHealthCheck(HealthChecker):
             writer.close()
             await writer.wait_closed()
 
-            logger.debug("TCP health check passed",
-                        host=host,
-                        port=port,
-                        response_time_ms=response_time_ms)
+            if _debug_enabled():
+                logger.debug("TCP health check passed",
+                            host=host,
+                            port=port,
+                            response_time_ms=response_time_ms)
 
-            return HealthCheckResult.healthy(
-                message=f"TCP connection to {host}:{port} successful",
-                response_time_ms=response_time_ms
-            )
+            # Success messages have no consumers; skip the format
+            return HealthCheckResult.healthy(response_time_ms=response_time_ms)
 
         except TimeoutError:
             logger.debug("TCP health check timed out",
@@ -210,7 +216,8 @@ class TCPHealthCheck(HealthChecker):
         start_port: int,
         end_port: int,
         host: str = "localhost",
-        timeout: float = 1.0
+        timeout: float = 1.0,
+        max_concurrency: int = 100
     ) -> dict[int, bool]:
         """Scan a range of ports for connectivity.
 
@@ -219,29 +226,36 @@ class TCPHealthCheck(HealthChecker):
             end_port: Ending port number (inclusive)
             host: Host to scan
             timeout: Timeout per port
+            max_concurrency: Maximum number of ports probed at once
 
         Returns:
             Dictionary mapping port numbers to connectivity status
         """
-        results = {}
-
-        # Create tasks for concurrent scanning
-        tasks = []
-        for port in range(start_port, end_port + 1):
-            task = asyncio.create_task(self._check_single_port(host, port, timeout))
-            tasks.append((port, task))
-
-        # Wait for all tasks to complete
-        for port, task in tasks:
-            try:
-                is_open = await task
-                results[port] = is_open
-            except Exception as e:
+        ports = range(start_port, end_port + 1)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def check_port(port: int) -> bool:
+            async with semaphore:
+                return await self._check_single_port(host, port, timeout)
+
+        # gather with return_exceptions so one failed probe cannot
+        # cancel the rest; worst-case latency is the slowest probe,
+        # not the sum of all of them
+        outcomes = await asyncio.gather(
+            *(check_port(port) for port in ports),
+            return_exceptions=True
+        )
+
+        results: dict[int, bool] = {}
+        for port, outcome in zip(ports, outcomes):
+            if isinstance(outcome, Exception):
                 logger.debug("Error scanning port",
                            port=port,
                            host=host,
-                           error=str(e))
+                           error=str(outcome))
                 results[port] = False
+            else:
+                results[port] = outcome
 
         return results
 
@@ -11,7 +11,7 @@ from ...domain.repositories.service_repository import (
     ServiceRepository,
 )
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
 
 
 class MemoryServiceRepository(ServiceRepository):
@@ -21,6 +21,7 @@ class MemoryServiceRepository(ServiceRepository):
         """Initialize the memory service repository."""
         self._services: dict[UUID, Service] = {}
         self._name_index: dict[str, UUID] = {}
+        self._version = 0
 
     async def save(self, service: Service) -> None:
         """Save a service.
@@ -41,6 +42,7 @@ class MemoryServiceRepository(ServiceRepository):
             # Save the service
             self._services[service.id] = service
             self._name_index[service.name] = service.id
+            self._version += 1
 
             logger.debug("Service saved",
                         service_id=service.id,
@@ -54,6 +56,46 @@ class MemoryServiceRepository(ServiceRepository):
                         error=str(e))
             raise RepositoryError(f"Failed to save service: {e}")
 
+    async def replace_all(self, services: list[Service]) -> None:
+        """Atomically replace the full service set.
+
+        Builds the new indexes off to the side and swaps them in with a
+        single assignment, so concurrent readers see either the old or the
+        new snapshot but never a mix.
+
+        Args:
+            services: The new complete list of services
+
+        Raises:
+            DuplicateServiceError: If two services share a name
+            RepositoryError: If the snapshot cannot be built
+        """
+        try:
+            new_services: dict[UUID, Service] = {}
+            new_name_index: dict[str, UUID] = {}
+            for service in services:
+                if service.name in new_name_index:
+                    raise DuplicateServiceError(service.name)
+                new_services[service.id] = service
+                new_name_index[service.name] = service.id
+
+            self._services = new_services
+            self._name_index = new_name_index
+            self._version += 1
+
+            logger.debug("Repository snapshot replaced", count=len(services))
+
+        except DuplicateServiceError:
+            raise
+        except Exception as e:
+            logger.error("Error replacing repository snapshot", error=str(e))
+            raise RepositoryError(f"Failed to replace services: {e}")
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every write, for snapshot caching."""
+        return self._version
+
     async def find_by_id(self, service_id: UUID) -> Service | None:
         """Find a service by ID.
 
@@ -206,6 +248,7 @@ class MemoryServiceRepository(ServiceRepository):
             # Remove from both indexes
             del self._services[service_id]
             del self._name_index[service.name]
+            self._version += 1
 
             logger.debug("Service deleted",
                         service_id=service_id,
@@ -271,6 +314,7 @@ class MemoryServiceRepository(ServiceRepository):
             count = len(self._services)
             self._services.clear()
             self._name_index.clear()
+            self._version += 1
 
             logger.debug("Repository cleared", previous_count=count)
 
@@ -305,6 +349,7 @@ class MemoryServiceRepository(ServiceRepository):
             for service in services:
                 self._services[service.id] = service
                 self._name_index[service.name] = service.id
+            self._version += 1
 
             logger.debug("Bulk save completed", count=len(services))
 
@@ -11,6 +11,14 @@ try:
     import yaml
 except ImportError:
     yaml = None
+    _YamlLoader = None
+else:
+    # Prefer the libyaml-backed C loader; it parses an order of magnitude
+    # faster than the pure-Python scanner. Resolved once at import time.
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
 
 from ...domain.entities.service import Service
 from ...domain.enums import ForwardingTechnology
@@ -21,7 +29,16 @@ from ...domain.repositories.config_repository import (
 from ...domain.value_objects.connection_info import ConnectionInfo
 from ...domain.value_objects.port import Port
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__)
+
+if yaml is not None and not hasattr(yaml, 'CSafeLoader'):
+    # Warn once at import time rather than on every load
+    logger.warning("libyaml not available, falling back to the pure-Python YAML loader")
+
+# Parsed configurations keyed by (path, mtime_ns, size). Repeated CLI
+# invocations and watch-mode refreshes skip parsing entirely while the
+# file on disk is unchanged; any write produces a new key.
+_CFG_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
 
 
 class YamlConfigRepository(ConfigRepository):
@@ -81,6 +98,14 @@ class YamlConfigRepository(ConfigRepository):
             return await self.get_default_configuration()
 
         try:
+            st = os.stat(self.config_path)
+            cache_key = (str(self.config_path), st.st_mtime_ns, st.st_size)
+            cached = _CFG_CACHE.get(cache_key)
+            if cached is not None:
+                self._config_cache = cached
+                logger.debug("Using cached configuration", path=str(self.config_path))
+                return cached
+
             with open(self.config_path, encoding='utf-8') as f:
                 content = f.read()
 
@@ -88,9 +113,10 @@ class YamlConfigRepository(ConfigRepository):
             content = self._substitute_environment_variables(content)
 
             # Parse YAML
-            config = yaml.safe_load(content) or {}
+            config = yaml.load(content, Loader=_YamlLoader) or {}
 
             # Cache the configuration
+            _CFG_CACHE[cache_key] = config
             self._config_cache = config
 
             logger.info("Loaded configuration",
@@ -550,6 +576,12 @@ class YamlConfigRepository(ConfigRepository):
     def clear_cache(self) -> None:
         """Clear the configuration cache."""
         self._config_cache = None
+        # Drop stat-keyed entries for this path too so a reload re-parses
+        # even if the file itself is unchanged (e.g. environment variables
+        # used in substitution may have changed).
+        path_str = str(self.config_path)
+        for key in [k for k in _CFG_CACHE if k[0] == path_str]:
+            del _CFG_CACHE[key]
         logger.debug("Cleared configuration cache")
 
     async def reload_configuration(self) -> dict[str, Any]:
@@ -660,6 +692,14 @@ class YamlConfigRepository(ConfigRepository):
             return await self.get_default_configuration()
 
         try:
+            st = os.stat(self.config_path)
+            cache_key = (str(self.config_path), st.st_mtime_ns, st.st_size)
+            cached = _CFG_CACHE.get(cache_key)
+            if cached is not None:
+                self._config_cache = cached
+                logger.debug("Using cached configuration", path=str(self.config_path))
+                return cached
+
             with open(self.config_path, encoding='utf-8') as f:
                 content = f.read()
 
@@ -667,9 +707,10 @@ class YamlConfigRepository(ConfigRepository):
             content = self._substitute_environment_variables(content)
 
             # Parse YAML
-            config = yaml.safe_load(content) or {}
+            config = yaml.load(content, Loader=_YamlLoader) or {}
 
             # Cache the configuration
+            _CFG_CACHE[cache_key] = config
             self._config_cache = config
 
             logger.info("Loaded configuration",
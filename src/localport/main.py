@@ -2,24 +2,24 @@
 
 import sys
 
-from rich.console import Console
-
-from .cli.app import cli_main
-
-console = Console()
-
 
 def main() -> None:
     """Main entry point for the LocalPort CLI."""
+    # Imported here so resolving the localport.main:main entry point
+    # does not pay for the full Typer/Rich CLI stack up front
+    from .cli.app import cli_main
+
     try:
         # Run the CLI application
         cli_main()
 
     except KeyboardInterrupt:
-        console.print("\n👋 Goodbye!")
+        # Plain print: no reason to boot Rich (terminal detection,
+        # color probing) just to say goodbye
+        print("\n👋 Goodbye!")
         sys.exit(0)
     except Exception as e:
-        console.print(f"❌ Error: {e}", style="red")
+        print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -26,7 +26,7 @@ class TestServiceEntity:
         assert service.local_port == 8080
         assert service.remote_port == 80
         assert service.status == ServiceStatus.STOPPED
-        assert service.tags == []
+        assert service.tags == set()
         assert service.connection_info == {"resource_name": "test"}
 
     def test_service_with_tags(self) -> None:
@@ -40,7 +40,7 @@ class TestServiceEntity:
             tags=["database", "essential"]
         )
 
-        assert service.tags == ["database", "essential"]
+        assert service.tags == {"database", "essential"}
 
     def test_service_health_check(self) -> None:
         """Test service health checking."""
@@ -105,7 +105,7 @@ class TestServiceEntity:
 
         # Adding same tag again doesn't duplicate
         service.add_tag("database")
-        assert service.tags.count("database") == 1
+        assert len(service.tags) == 1
 
         # Add another tag
         service.add_tag("essential")